@@ -1,16 +1,146 @@
 import google.generativeai as genai
-from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta, date
+from typing import Dict, List, Optional, Any, Iterator
+from datetime import datetime, timedelta, date, timezone
+from zoneinfo import ZoneInfo
 import re
+import json
 import logging
+import asyncio
 import os
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from types import MappingProxyType
 from dotenv import load_dotenv
-import pytz
+from app.config import settings
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# User-facing times are IST; parsed schedule times are returned in UTC
+IST = ZoneInfo('Asia/Kolkata')
+UTC = timezone.utc
+
+# Response cache for _call_ai (exact prompt match); only temperature 0 calls are cached
+AI_CACHE_TTL_SECONDS = 3600
+AI_CACHE_MAX_ENTRIES = 4096
+
+# Patterns used to interpret user input and AI model output
+_IMMEDIATE_RE = re.compile(r'\b(immediately|now|right now|asap|as soon as possible)\b')
+_RELATIVE_TO_NOW_RE = re.compile(
+    r'\b(?:in\s+(?:\d+|an?|half\s+an)\s*(?:min|mins|minutes?|hrs?|hours?)'
+    r'|this\s+(?:morning|afternoon|evening)|later|soon)\b'
+)
+_DATETIME_RE = re.compile(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2})')
+_EVENT_ID_RE = re.compile(r'EVT\d+', re.IGNORECASE)
+
+# Comment classification categories, and the ones we reply to automatically
+COMMENT_CATEGORIES = ("event-related", "off-topic", "spam", "negative", "accessibility")
+RESPOND_CATEGORIES = frozenset({"event-related", "accessibility"})
+
+# Keyword indicators that override the AI classification
+SPAM_INDICATORS = frozenset({"buy now", "click here", "make money", "earn cash", "free money", "lottery", "winner", "urgent", "limited time"})
+NEGATIVE_INDICATORS = frozenset({"terrible", "awful", "horrible", "worst", "hate", "disappointed", "angry", "frustrated"})
+
+# Date parsing prompt; today's date, the current time and the user input are
+# filled in per call so the template never goes stale in a long-running process
+DATE_PARSING_PROMPT_TEMPLATE = """
+        Parse the date and time from the user input given at the end.
+        Return only the parsed date and time in ISO format (YYYY-MM-DD HH:MM).
+        If no specific time is mentioned, use 10:00 AM as default.
+        
+        CRITICAL: Use the "Today's date" given below as the reference date.
+        When user says "today", "this morning", "this afternoon", etc., use today's actual date.
+        When user says "tomorrow", use tomorrow's date.
+        When user says "next [day]", calculate from today's date.
+        When user says "immediately", "now", "right now", "asap", use current time + 2 minutes.
+        
+        IMPORTANT: Treat all times as local time (IST - India Standard Time). 
+        Do NOT convert to UTC. Return the time exactly as specified by the user.
+        
+        Examples (assuming today is 2025-01-15 and the current time is 09:30):
+        - "today at 8:18 AM" → 2025-01-15 08:18
+        - "today at 2 PM" → 2025-01-15 14:00
+        - "tomorrow at 3 PM" → 2025-01-16 15:00
+        - "8:18 AM" → 2025-01-15 08:18
+        - "this morning" → 2025-01-15 10:00
+        - "immediately" → 2025-01-15 09:32
+        - "now" → 2025-01-15 09:32
+        
+        Today's date: {today}
+        Current time: {current_time}
+        User input: {user_input}
+        
+        Parsed date and time (local time):
+        """
+
+# Memoized parse_schedule_request results (fast path and AI model), keyed on (normalized input, today).
+# Phrases relative to the current time ("in 2 hours", "this evening") are never stored
+PARSE_CACHE_TTL_SECONDS = 3600
+PARSE_CACHE_MAX_ENTRIES = 2048
+
+# Memoized find_matching_event results, keyed on (normalized query, event catalog fingerprint)
+MATCH_CACHE_TTL_SECONDS = 300
+MATCH_CACHE_MAX_ENTRIES = 512
+
+# Fast-path patterns for parse_schedule_request (inputs are lowercased). Each must match
+# the whole input: any other words ("day after", a second time, an event date) go to the AI model
+_ISO_DATETIME_RE = re.compile(r'\s*(\d{4})-(\d{2})-(\d{2})[ t](\d{2}):(\d{2})\s*')
+_RELATIVE_DATETIME_RE = re.compile(r'\s*(today|tomorrow|tonight)\s+at\s+(\d{1,2})(?::(\d{2}))?\s*(am|pm)?\s*')
+_TIME_ONLY_RE = re.compile(r'\s*(?:at\s+)?(\d{1,2})(?::(\d{2}))?\s*(am|pm)?\s*')
+
+# Content settings for platforms missing from settings.PLATFORM_CONFIGS
+DEFAULT_PLATFORM_CONFIG = MappingProxyType({"tone": "professional", "max_length": 1000, "hashtag_limit": 5})
+
+# Output limits per task, so the model stops generating instead of relying
+# only on length instructions in the prompt (~4 characters per token)
+POST_GENERATION_CONFIG = {"max_output_tokens": 160, "temperature": 0.7}
+BLOG_GENERATION_CONFIG = {"max_output_tokens": 1024, "temperature": 0.7}
+MULTI_PLATFORM_GENERATION_CONFIG = {"max_output_tokens": 2048, "temperature": 0.7}
+CLASSIFICATION_GENERATION_CONFIG = {"max_output_tokens": 128, "temperature": 0.0}
+DATE_PARSING_GENERATION_CONFIG = {"max_output_tokens": 64, "temperature": 0.0}
+EVENT_MATCHING_GENERATION_CONFIG = {"max_output_tokens": 64, "temperature": 0.0}
+
+# Upper bound on concurrent Gemini requests issued by the async batch helpers
+AI_MAX_CONCURRENT_REQUESTS = 20
+
+# Long-lived event loop for running async AI calls from synchronous code. The async
+# Gemini client binds to the loop it was first used on, so one loop is kept for the process.
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_loop_lock = threading.Lock()
+
+def run_async(coro) -> Any:
+    """Run a coroutine on the shared background event loop and wait for its result"""
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None:
+            _background_loop = asyncio.new_event_loop()
+            threading.Thread(target=_background_loop.run_forever, name="ai-async-loop", daemon=True).start()
+    return asyncio.run_coroutine_threadsafe(coro, _background_loop).result()
+
+@lru_cache(maxsize=1024)
+def _parse_event_date(event_date: Any) -> Optional[date]:
+    """Parse an event date given as a date, datetime or ISO string ("YYYY-MM-DD[ HH:MM:SS]")"""
+    if isinstance(event_date, datetime):
+        return event_date.date()
+    if isinstance(event_date, date):
+        return event_date
+    if isinstance(event_date, str):
+        try:
+            return date.fromisoformat(event_date[:10])
+        except ValueError:
+            return None
+    return None
+
 class AICommunicationAgent:
+    # Spam and negative indicators, compiled once and matched on word boundaries
+    _INDICATOR_RE = re.compile(
+        r'\b(?:(?P<spam>' + '|'.join(map(re.escape, sorted(SPAM_INDICATORS))) + r')'
+        r'|(?P<negative>' + '|'.join(map(re.escape, sorted(NEGATIVE_INDICATORS))) + r'))\b'
+    )
+    
     def __init__(self):
         """Initialize the AI Communication Agent with Gemini"""
         api_key = os.getenv("GOOGLE_API_KEY")
@@ -19,72 +149,94 @@ class AICommunicationAgent:
         
         genai.configure(api_key=api_key)
         self.model = genai.GenerativeModel('models/gemini-2.0-flash-exp')
+        self._response_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+        self._parse_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._parse_cache_lock = threading.Lock()
+        self._match_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._match_cache_lock = threading.Lock()
         self._setup_prompts()
     
     def _setup_prompts(self):
-        """Setup prompt templates for different tasks"""
-        current_date = datetime.now()
-        current_year = current_date.year
-        current_month = current_date.month
-        current_day = current_date.day
-        
-        self.date_parsing_prompt = f"""
-        Parse the date and time from the following user input. 
-        Return only the parsed date and time in ISO format (YYYY-MM-DD HH:MM).
-        If no specific time is mentioned, use 10:00 AM as default.
+        """Setup prompt templates for different tasks.
         
-        CRITICAL: Today's date is {current_year}-{current_month:02d}-{current_day:02d}.
-        When user says "today", "this morning", "this afternoon", etc., use today's actual date.
-        When user says "tomorrow", use tomorrow's date.
-        When user says "next [day]", calculate from today's date.
-        When user says "immediately", "now", "right now", "asap", use current time + 2 minutes.
+        Static instructions and examples come first and the per-call data is
+        appended last, so identical prefixes can be reused by the provider's
+        prompt caching across calls. The date parsing prompt is the module-level
+        DATE_PARSING_PROMPT_TEMPLATE.
+        """
+        self.content_generation_prompt = """
+        Create a social media post about the event described at the end.
         
-        IMPORTANT: Treat all times as local time (IST - India Standard Time). 
-        Do NOT convert to UTC. Return the time exactly as specified by the user.
+        Create engaging, platform-optimized content that encourages registration.
+        Include relevant hashtags and call-to-action.
         
-        User input: {{user_input}}
+        Do not exceed 500 characters.
         
-        Examples (assuming today is {current_year}-{current_month:02d}-{current_day:02d}):
-        - "today at 8:18 AM" → {current_year}-{current_month:02d}-{current_day:02d} 08:18
-        - "today at 2 PM" → {current_year}-{current_month:02d}-{current_day:02d} 14:00
-        - "tomorrow at 3 PM" → {current_year}-{current_month:02d}-{(current_day + 1):02d} 15:00
-        - "8:18 AM" → {current_year}-{current_month:02d}-{current_day:02d} 08:18
-        - "this morning" → {current_year}-{current_month:02d}-{current_day:02d} 10:00
-        - "immediately" → {current_year}-{current_month:02d}-{current_day:02d} {(current_date.hour + 1) % 24:02d}:{(current_date.minute + 2) % 60:02d}
-        - "now" → {current_year}-{current_month:02d}-{current_day:02d} {(current_date.hour + 1) % 24:02d}:{(current_date.minute + 2) % 60:02d}
+        For LinkedIn: Return only ONE concise, plain text post. Do NOT use markdown, bold, headings, numbering, or options. Do NOT return multiple options. Do NOT use asterisks or any formatting. Just return a simple text post.
         
-        Parsed date and time (local time):
+        Platform-specific requirements:
+        - Platform: {platform}
+        - Tone: {tone}
+        
+        Event: {event_title}
+        Description: {event_description}
+        Date: {event_date}
+        Registration: {registration_link}
+        
+        Post content:
         """
         
-        self.content_generation_prompt = """
-        Create a social media post for {platform} about the following event:
+        self.devto_content_prompt = """
+        Create a technical blog post for Dev.to about the event described at the end.
+        
+        Requirements:
+        - Tone: Technical and informative
+        - Format: Markdown with proper headings, code blocks if relevant
+        - Include: Introduction, event details, why to attend, registration info
+        - Hashtags: Up to 8 relevant technical hashtags
+        - Length: 250-500 words
+        
+        Create an engaging technical blog post that encourages developers to register.
+        Use markdown formatting with # for main title, ## for sections, and ### for subsections.
+        Do not write the word markdown in the post. Just use the markdown formatting.
         
         Event: {event_title}
         Description: {event_description}
         Date: {event_date}
         Registration: {registration_link}
         
-        Platform-specific requirements:
-        - Tone: {tone}
-        - Platform: {platform}
+        Blog post content:
+        """
         
-        Create engaging, platform-optimized content that encourages registration.
-        Include relevant hashtags and call-to-action.
+        self.multi_platform_content_prompt = """
+        Create social media content for several platforms about the event described at the end.
         
-        Do not exceed 500 characters.
+        Create engaging, platform-optimized content that encourages registration.
+        Include relevant hashtags and call-to-action, respecting each platform's hashtag limit.
+        Respect each platform's maximum length in characters.
         
-        For LinkedIn: Return only ONE concise, plain text post. Do NOT use markdown, bold, headings, numbering, or options. Do NOT return multiple options. Do NOT use asterisks or any formatting. Just return a simple text post.
+        Platform rules:
+        - linkedin: ONE concise, plain text post. No markdown, bold, headings, numbering, options or asterisks.
+        - twitter: ONE short conversational post.
+        - devto: A technical blog post in markdown (# for the main title, ## for sections, ### for subsections),
+          250-500 words, with introduction, event details, why to attend and registration info.
+          Do not write the word markdown in the post.
         
-        Post content:
-        """
+        Return ONLY a JSON object whose keys are the platform ids and whose values are the post content strings.
         
-        self.comment_classification_prompt = """
-        Classify the following comment based on its intent regarding the event:
+        Platform requirements (JSON): {platform_specs}
         
         Event: {event_title}
-        Event Description: {event_description}
+        Description: {event_description}
+        Date: {event_date}
+        Registration: {registration_link}
         
-        Comment: {comment_text}
+        JSON:
+        """
+        
+        self.comment_classification_prompt = """
+        Classify the comment given at the end based on its intent regarding the event.
         
         Classify as one of:
         - event-related: Questions about the event, registration, recording, etc.
@@ -95,17 +247,19 @@ class AICommunicationAgent:
         
         Also provide a confidence score (0-100) and brief reasoning.
         
-        Classification:
-        """
+        Return ONLY a JSON object of the form:
+        {{"classification": "<one of the categories above>", "confidence": <0-100>, "reasoning": "<brief reasoning>"}}
         
-        self.response_generation_prompt = """
-        Generate a helpful response to the following comment:
+        Event: {event_title}
+        Event Description: {event_description}
         
         Comment: {comment_text}
-        Classification: {classification}
-        Event: {event_title}
-        Registration Link: {registration_link}
-        Will be recorded: {is_recorded}
+        
+        JSON:
+        """
+        
+        self.response_generation_prompt = """
+        Generate a helpful response to the comment given at the end.
         
         Guidelines:
         - Be friendly and professional
@@ -114,26 +268,166 @@ class AICommunicationAgent:
         - For event-related questions, include relevant details
         - For off-topic comments, politely redirect to event questions
         
+        Event: {event_title}
+        Registration Link: {registration_link}
+        Will be recorded: {is_recorded}
+        Classification: {classification}
+        
+        Comment: {comment_text}
+        
         Response:
         """
     
-    def _call_ai(self, prompt: str) -> str:
-        """Make a call to the AI model"""
+    def _get_cached_response(self, key: str) -> Optional[str]:
+        """Return a cached AI response if present and not expired"""
+        with self._response_cache_lock:
+            entry = self._response_cache.get(key)
+            if entry is None:
+                return None
+            expires_at, text = entry
+            if expires_at < time.monotonic():
+                del self._response_cache[key]
+                return None
+            self._response_cache.move_to_end(key)
+            return text
+    
+    def _store_cached_response(self, key: str, text: str):
+        """Store an AI response, evicting the least recently used entries"""
+        with self._response_cache_lock:
+            self._response_cache[key] = (time.monotonic() + AI_CACHE_TTL_SECONDS, text)
+            self._response_cache.move_to_end(key)
+            while len(self._response_cache) > AI_CACHE_MAX_ENTRIES:
+                self._response_cache.popitem(last=False)
+    
+    @staticmethod
+    def _cache_key(prompt: str, generation_config: Optional[Dict[str, Any]]) -> str:
+        """Cache key for a prompt and the generation settings it is sent with"""
+        if generation_config:
+            prompt = f"{sorted(generation_config.items())}\n{prompt}"
+        return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+    
+    @staticmethod
+    def _is_cacheable(generation_config: Optional[Dict[str, Any]]) -> bool:
+        """Only deterministic (temperature 0) calls are cached; generated posts and replies must vary"""
+        return bool(generation_config) and generation_config.get("temperature") == 0
+    
+    def _call_ai(self, prompt: str, use_cache: bool = True, generation_config: Optional[Dict[str, Any]] = None) -> str:
+        """Make a call to the AI model, reusing cached responses for identical deterministic prompts"""
+        use_cache = use_cache and self._is_cacheable(generation_config)
+        key = self._cache_key(prompt, generation_config)
+        if use_cache:
+            cached = self._get_cached_response(key)
+            if cached is not None:
+                logger.debug("AI response cache hit")
+                return cached
         try:
-            response = self.model.generate_content(prompt)
-            return response.text.strip()
+            response = self.model.generate_content(prompt, generation_config=generation_config)
+            text = response.text.strip()
         except Exception as e:
             logger.error(f"Error calling AI model: {e}")
             raise
+        if use_cache and text:
+            self._store_cached_response(key, text)
+        return text
+    
+    def _call_ai_stream(self, prompt: str, use_cache: bool = True, generation_config: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+        """Stream the AI model response as text chunks as they arrive.
+        
+        A cached response is yielded as a single chunk; a fully streamed
+        response is stored in the cache like _call_ai does.
+        """
+        use_cache = use_cache and self._is_cacheable(generation_config)
+        key = self._cache_key(prompt, generation_config)
+        if use_cache:
+            cached = self._get_cached_response(key)
+            if cached is not None:
+                logger.debug("AI response cache hit")
+                yield cached
+                return
+        parts = []
+        try:
+            for chunk in self.model.generate_content(prompt, generation_config=generation_config, stream=True):
+                text = chunk.text
+                if text:
+                    parts.append(text)
+                    yield text
+        except Exception as e:
+            logger.error(f"Error streaming AI model response: {e}")
+            raise
+        full_text = "".join(parts).strip()
+        if use_cache and full_text:
+            self._store_cached_response(key, full_text)
+    
+    async def _acall_ai(self, prompt: str, use_cache: bool = True, generation_config: Optional[Dict[str, Any]] = None) -> str:
+        """Async variant of _call_ai sharing the same model and response cache"""
+        use_cache = use_cache and self._is_cacheable(generation_config)
+        key = self._cache_key(prompt, generation_config)
+        if use_cache:
+            cached = self._get_cached_response(key)
+            if cached is not None:
+                logger.debug("AI response cache hit")
+                return cached
+        try:
+            response = await self.model.generate_content_async(prompt, generation_config=generation_config)
+            text = response.text.strip()
+        except Exception as e:
+            logger.error(f"Error calling AI model: {e}")
+            raise
+        if use_cache and text:
+            self._store_cached_response(key, text)
+        return text
+    
+    @staticmethod
+    def _fast_parse_datetime(text: str, now: datetime) -> Optional[datetime]:
+        """Parse unambiguous date/time phrases without calling the AI model.
+        
+        Handles inputs that are exactly an ISO timestamp, "today/tomorrow/tonight
+        at H[:MM] [am|pm]" or a bare "H:MM [am|pm]". Returns a naive local
+        datetime, or None when the input needs the AI model to interpret it.
+        """
+        iso_match = _ISO_DATETIME_RE.fullmatch(text)
+        if iso_match:
+            year, month, day, hour, minute = (int(g) for g in iso_match.groups())
+            try:
+                return datetime(year, month, day, hour, minute)
+            except ValueError:
+                return None
+        
+        day_word = None
+        time_match = _RELATIVE_DATETIME_RE.fullmatch(text)
+        if time_match:
+            day_word, hour, minute, meridiem = time_match.groups()
+        else:
+            time_match = _TIME_ONLY_RE.fullmatch(text)
+            if not time_match:
+                return None
+            hour, minute, meridiem = time_match.groups()
+        
+        # "at 3" on its own is ambiguous (AM or PM), leave it to the AI model
+        if minute is None and meridiem is None:
+            return None
+        hour = int(hour)
+        minute = int(minute) if minute is not None else 0
+        if meridiem:
+            if not 1 <= hour <= 12:
+                return None
+            hour = hour % 12 + (12 if meridiem == "pm" else 0)
+        elif day_word == "tonight" and hour < 12:
+            hour += 12
+        if hour > 23 or minute > 59:
+            return None
+        
+        parsed = datetime(now.year, now.month, now.day, hour, minute)
+        if day_word == "tomorrow":
+            parsed += timedelta(days=1)
+        return parsed
     
     def parse_schedule_request(self, user_input: str) -> Dict[str, Any]:
         """Parse natural language scheduling requests"""
         try:
             # Check for immediate posting requests first
             user_input_lower = user_input.lower()
-            immediate_keywords = ['immediately', 'now', 'right now', 'asap', 'as soon as possible']
-            
-            if any(keyword in user_input_lower for keyword in immediate_keywords):
+            if _IMMEDIATE_RE.search(user_input_lower):
                 # Set time to current time + 2 minutes for immediate posting
                 current_time = datetime.now()
                 immediate_time = current_time + timedelta(minutes=2)
@@ -141,9 +435,8 @@ class AICommunicationAgent:
                 logger.info(f"User requested immediate posting, setting time to: {immediate_time}")
                 
                 # Treat as IST and convert to UTC
-                ist = pytz.timezone('Asia/Kolkata')
-                immediate_time_ist = ist.localize(immediate_time.replace(tzinfo=None))
-                immediate_time_utc = immediate_time_ist.astimezone(pytz.utc)
+                immediate_time_ist = immediate_time.replace(tzinfo=IST)
+                immediate_time_utc = immediate_time_ist.astimezone(UTC)
                 
                 return {
                     "success": True,
@@ -152,57 +445,87 @@ class AICommunicationAgent:
                     "immediate": True
                 }
             
-            prompt = self.date_parsing_prompt.format(user_input=user_input)
-            result = self._call_ai(prompt)
+            # Identical requests on the same day always parse to the same time
+            cache_key = (" ".join(user_input_lower.split()), date.today().toordinal())
+            with self._parse_cache_lock:
+                cached = self._parse_cache.get(cache_key)
+                cached_result = None
+                if cached is not None:
+                    expires_at, cached_result = cached
+                    if time.monotonic() >= expires_at:
+                        del self._parse_cache[cache_key]
+                        cached_result = None
+            if cached_result is not None:
+                logger.info(f"Using cached schedule parse: {cached_result['datetime']} (UTC)")
+                return dict(cached_result)
             
-            # Extract date and time from result
-            date_match = re.search(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2})', result)
-            if date_match:
-                parsed_datetime = datetime.fromisoformat(date_match.group(1))
-                
-                # Get current date for validation
-                current_date = datetime.now()
-                
-                # If user mentioned "today" or similar, ensure we're using today's date
-                if any(word in user_input_lower for word in ['today', 'this morning', 'this afternoon', 'this evening', 'tonight']):
-                    # Force today's date if user explicitly mentioned "today"
-                    parsed_datetime = parsed_datetime.replace(
-                        year=current_date.year,
-                        month=current_date.month,
-                        day=current_date.day
-                    )
-                    logger.info(f"User mentioned 'today', forcing date to: {parsed_datetime.date()}")
-                
-                # Ensure the parsed date is not in the past (unless it's today)
-                if parsed_datetime.date() < current_date.date():
-                    logger.warning(f"Parsed date {parsed_datetime.date()} is in the past, adjusting to today")
-                    parsed_datetime = parsed_datetime.replace(
-                        year=current_date.year,
-                        month=current_date.month,
-                        day=current_date.day
-                    )
-                
-                # Treat the parsed datetime as IST (local time) and convert to UTC
-                ist = pytz.timezone('Asia/Kolkata')
-                if parsed_datetime.tzinfo is None:
-                    # Assume the parsed time is in IST
-                    parsed_datetime_ist = ist.localize(parsed_datetime)
-                    # Convert to UTC for storage
-                    parsed_datetime = parsed_datetime_ist.astimezone(pytz.utc)
-                
-                logger.info(f"Final parsed datetime: {parsed_datetime} (UTC)")
-                
-                return {
-                    "success": True,
-                    "datetime": parsed_datetime,
-                    "confidence": 0.9
-                }
+            now = datetime.now()
+            parsed_datetime = self._fast_parse_datetime(user_input_lower, now)
+            if parsed_datetime is not None:
+                logger.info(f"Parsed schedule request without AI: {parsed_datetime}")
+                confidence = 0.95
             else:
-                return {
-                    "success": False,
-                    "error": "Could not parse date and time",
-                    "confidence": 0.0
-                }
+                prompt = DATE_PARSING_PROMPT_TEMPLATE.format_map({
+                    "today": now.strftime("%Y-%m-%d"),
+                    "current_time": now.strftime("%H:%M"),
+                    "user_input": user_input
+                })
+                result = self._call_ai(prompt, generation_config=DATE_PARSING_GENERATION_CONFIG)
+                
+                # Extract date and time from result
+                date_match = _DATETIME_RE.search(result)
+                if not date_match:
+                    return {
+                        "success": False,
+                        "error": "Could not parse date and time",
+                        "confidence": 0.0
+                    }
+                parsed_datetime = datetime.fromisoformat(date_match.group(1))
+                confidence = 0.9
+            
+            # Get current date for validation
+            current_date = datetime.now()
+            
+            # If user mentioned "today" or similar, ensure we're using today's date
+            if any(word in user_input_lower for word in ['today', 'this morning', 'this afternoon', 'this evening', 'tonight']):
+                # Force today's date if user explicitly mentioned "today"
+                parsed_datetime = parsed_datetime.replace(
+                    year=current_date.year,
+                    month=current_date.month,
+                    day=current_date.day
+                )
+                logger.info(f"User mentioned 'today', forcing date to: {parsed_datetime.date()}")
+            
+            # Ensure the parsed date is not in the past (unless it's today)
+            if parsed_datetime.date() < current_date.date():
+                logger.warning(f"Parsed date {parsed_datetime.date()} is in the past, adjusting to today")
+                parsed_datetime = parsed_datetime.replace(
+                    year=current_date.year,
+                    month=current_date.month,
+                    day=current_date.day
+                )
+            
+            # Treat the parsed datetime as IST (local time) and convert to UTC
+            if parsed_datetime.tzinfo is None:
+                # Assume the parsed time is in IST
+                parsed_datetime_ist = parsed_datetime.replace(tzinfo=IST)
+                # Convert to UTC for storage
+                parsed_datetime = parsed_datetime_ist.astimezone(UTC)
+            
+            logger.info(f"Final parsed datetime: {parsed_datetime} (UTC)")
+            
+            result = {
+                "success": True,
+                "datetime": parsed_datetime,
+                "confidence": confidence
+            }
+            if not _RELATIVE_TO_NOW_RE.search(user_input_lower):
+                with self._parse_cache_lock:
+                    self._parse_cache[cache_key] = (time.monotonic() + PARSE_CACHE_TTL_SECONDS, result)
+                    self._parse_cache.move_to_end(cache_key)
+                    while len(self._parse_cache) > PARSE_CACHE_MAX_ENTRIES:
+                        self._parse_cache.popitem(last=False)
+            return dict(result)
         except Exception as e:
             logger.error(f"Error parsing schedule request: {e}")
             return {
@@ -211,61 +534,72 @@ class AICommunicationAgent:
                 "confidence": 0.0
             }
     
+    def _build_content_prompt(self, platform: str, event_data: Dict[str, Any]):
+        """Build the content generation prompt.
+        
+        Returns (prompt, platform_config, generation_config).
+        """
+        platform_key = platform.lower()
+        platform_config = settings.PLATFORM_CONFIGS.get(platform_key, DEFAULT_PLATFORM_CONFIG)
+        
+        # Special handling for Dev.to (technical blog posts)
+        if platform_key == "devto":
+            prompt = self.devto_content_prompt.format(
+                event_title=event_data.get("title", ""),
+                event_description=event_data.get("description", ""),
+                event_date=event_data.get("date", ""),
+                registration_link=event_data.get("registration_link", "")
+            )
+            generation_config = BLOG_GENERATION_CONFIG
+        else:
+            generation_config = POST_GENERATION_CONFIG
+            prompt = self.content_generation_prompt.format(
+                platform=platform,
+                event_title=event_data.get("title", ""),
+                event_description=event_data.get("description", ""),
+                event_date=event_data.get("date", ""),
+                registration_link=event_data.get("registration_link", ""),
+                tone=platform_config.get("tone", "professional")
+            )
+        return prompt, platform_config, generation_config
+    
+    @staticmethod
+    def _content_result(platform: str, platform_config: Dict[str, Any], result: str) -> Dict[str, Any]:
+        """Build the generate_platform_content result from the AI output"""
+        return {
+            "success": True,
+            "content": result.strip(),
+            "platform": platform,
+            "max_length": platform_config.get("max_length", 1000),
+            "hashtag_limit": platform_config.get("hashtag_limit", 5),
+            "supports_markdown": platform_config.get("supports_markdown", False)
+        }
+    
     def generate_platform_content(self, platform: str, event_data: Dict[str, Any]) -> Dict[str, Any]:
         """Generate platform-specific content for social media posts"""
         try:
-            # Platform configurations
-            platform_configs = {
-                "linkedin": {"tone": "professional", "max_length": 300, "hashtag_limit": 5},
-                "twitter": {"tone": "conversational", "max_length": 280, "hashtag_limit": 3},
-                "devto": {"tone": "technical", "max_length": 500, "hashtag_limit": 4, "supports_markdown": True}
-            }
-            
-            platform_config = platform_configs.get(platform.lower(), {"tone": "professional", "max_length": 1000, "hashtag_limit": 5})
-            
-            # Special handling for Dev.to (technical blog posts)
-            if platform.lower() == "devto":
-                prompt = f"""
-                Create a technical blog post for Dev.to about the following event:
-                
-                Event: {event_data.get("title", "")}
-                Description: {event_data.get("description", "")}
-                Date: {event_data.get("date", "")}
-                Registration: {event_data.get("registration_link", "")}
-                
-                Requirements:
-                - Tone: Technical and informative
-                - Format: Markdown with proper headings, code blocks if relevant
-                - Include: Introduction, event details, why to attend, registration info
-                - Hashtags: Up to 8 relevant technical hashtags
-                - Length: 250-500 words
-                
-                Create an engaging technical blog post that encourages developers to register.
-                Use markdown formatting with # for main title, ## for sections, and ### for subsections.
-                Do not write the word markdown in the post. Just use the markdown formatting.
-                
-                Blog post content:
-                """
-            else:
-                prompt = self.content_generation_prompt.format(
-                    platform=platform,
-                    event_title=event_data.get("title", ""),
-                    event_description=event_data.get("description", ""),
-                    event_date=event_data.get("date", ""),
-                    registration_link=event_data.get("registration_link", ""),
-                    tone=platform_config.get("tone", "professional")
-                )
-            
-            result = self._call_ai(prompt)
-            
+            prompt, platform_config, generation_config = self._build_content_prompt(platform, event_data)
+            result = self._call_ai(prompt, generation_config=generation_config)
+            return self._content_result(platform, platform_config, result)
+        except Exception as e:
+            logger.error(f"Error generating content for {platform}: {e}")
             return {
-                "success": True,
-                "content": result.strip(),
-                "platform": platform,
-                "max_length": platform_config.get("max_length", 1000),
-                "hashtag_limit": platform_config.get("hashtag_limit", 5),
-                "supports_markdown": platform_config.get("supports_markdown", False)
+                "success": False,
+                "error": str(e),
+                "platform": platform
             }
+    
+    def generate_platform_content_stream(self, platform: str, event_data: Dict[str, Any]) -> Iterator[str]:
+        """Stream platform-specific content as it is generated"""
+        prompt, _, generation_config = self._build_content_prompt(platform, event_data)
+        return self._call_ai_stream(prompt, generation_config=generation_config)
+    
+    async def agenerate_platform_content(self, platform: str, event_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Async variant of generate_platform_content"""
+        try:
+            prompt, platform_config, generation_config = self._build_content_prompt(platform, event_data)
+            result = await self._acall_ai(prompt, generation_config=generation_config)
+            return self._content_result(platform, platform_config, result)
         except Exception as e:
             logger.error(f"Error generating content for {platform}: {e}")
             return {
@@ -274,6 +608,135 @@ class AICommunicationAgent:
                 "platform": platform
             }
     
+    def generate_multi_platform_content(self, platforms: List[str], event_data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """Generate content for several platforms with a single AI call.
+        
+        Returns a dict keyed by platform with the same result shape as
+        generate_platform_content. Platforms missing from the AI output are
+        generated individually as a fallback.
+        """
+        if len(platforms) <= 1:
+            return {platform: self.generate_platform_content(platform, event_data) for platform in platforms}
+        
+        platform_configs = {
+            platform: settings.PLATFORM_CONFIGS.get(platform.lower(), DEFAULT_PLATFORM_CONFIG)
+            for platform in platforms
+        }
+        results = {}
+        try:
+            platform_specs = {
+                platform.lower(): {
+                    "tone": config.get("tone", "professional"),
+                    "max_length": config.get("max_length", 1000),
+                    "hashtag_limit": config.get("hashtag_limit", 5)
+                }
+                for platform, config in platform_configs.items()
+            }
+            prompt = self.multi_platform_content_prompt.format(
+                platform_specs=json.dumps(platform_specs),
+                event_title=event_data.get("title", ""),
+                event_description=event_data.get("description", ""),
+                event_date=event_data.get("date", ""),
+                registration_link=event_data.get("registration_link", "")
+            )
+            contents = self._parse_json_object(self._call_ai(prompt, generation_config=MULTI_PLATFORM_GENERATION_CONFIG))
+            for platform, config in platform_configs.items():
+                content = contents.get(platform.lower())
+                if isinstance(content, str) and content.strip():
+                    results[platform] = self._content_result(platform, config, content)
+        except Exception as e:
+            logger.error(f"Error generating multi-platform content: {e}")
+        
+        for platform in platforms:
+            if platform not in results:
+                logger.info(f"Falling back to single-platform content generation for {platform}")
+                results[platform] = self.generate_platform_content(platform, event_data)
+        return results
+    
+    @staticmethod
+    def _parse_json_object(text: str) -> Dict[str, Any]:
+        """Extract a JSON object from AI output, tolerating code fences and surrounding text"""
+        start = text.find("{")
+        end = text.rfind("}")
+        if start == -1 or end < start:
+            raise ValueError("No JSON object found in AI response")
+        parsed = json.loads(text[start:end + 1])
+        if not isinstance(parsed, dict):
+            raise ValueError("AI response JSON is not an object")
+        return parsed
+    
+    def _build_classification_prompt(self, comment_text: str, event_data: Optional[Dict[str, Any]]) -> str:
+        """Build the comment classification prompt"""
+        if event_data is None:
+            event_data = {"title": "", "description": ""}
+        
+        return self.comment_classification_prompt.format(
+            comment_text=comment_text,
+            event_title=event_data.get("title", ""),
+            event_description=event_data.get("description", "")
+        )
+    
+    def _find_indicators(self, comment_text: str) -> Dict[str, str]:
+        """Scan the comment once and return {"spam"/"negative": first matched indicator}"""
+        indicator_hits = {}
+        for match in self._INDICATOR_RE.finditer(comment_text.lower()):
+            indicator_hits.setdefault(match.lastgroup, match.group(0))
+        return indicator_hits
+    
+    def _parse_classification(self, result: str, indicator_hits: Dict[str, str]) -> Dict[str, Any]:
+        """Parse the AI classification output and apply keyword overrides"""
+        classification = "event-related"  # default
+        confidence = 50  # default
+        reasoning = ""
+        try:
+            parsed = self._parse_json_object(result)
+            if str(parsed.get("classification", "")).lower() in COMMENT_CATEGORIES:
+                classification = str(parsed["classification"]).lower()
+            confidence = max(0, min(100, int(parsed.get("confidence", confidence))))
+            reasoning = str(parsed.get("reasoning", ""))
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Could not parse classification JSON, using defaults: {e}")
+        
+        # Determine if we should respond based on classification
+        should_respond = classification in RESPOND_CATEGORIES
+        
+        # Additional validation for spam detection
+        if "spam" in indicator_hits:
+            classification = "spam"
+            confidence = 90
+            should_respond = False
+        
+        # Additional validation for negative sentiment
+        if "negative" in indicator_hits:
+            if classification == "event-related":
+                classification = "negative"
+                confidence = 80
+        
+        return {
+            "success": True,
+            "classification": classification,
+            "confidence": confidence,
+            "reasoning": reasoning,
+            "should_respond": should_respond
+        }
+    
+    @staticmethod
+    def _prescreen_comment(indicator_hits: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        """Classify obvious spam locally, without an AI call.
+        
+        Spam indicators always override the AI classification, so when one is
+        present the AI result would be discarded anyway.
+        """
+        if "spam" in indicator_hits:
+            return {
+                "success": True,
+                "classification": "spam",
+                "confidence": 90,
+                "reasoning": f"Matched spam indicator '{indicator_hits['spam']}'",
+                "should_respond": False
+            }
+        return None
+    
     def classify_comment(self, comment_text: str, event_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Classify comment intent and determine appropriate response"""
         try:
@@ -285,62 +748,42 @@ class AICommunicationAgent:
                     "should_respond": False
                 }
             
-            if event_data is None:
-                event_data = {"title": "", "description": ""}
-            
-            prompt = self.comment_classification_prompt.format(
-                comment_text=comment_text,
-                event_title=event_data.get("title", ""),
-                event_description=event_data.get("description", "")
-            )
-            
-            result = self._call_ai(prompt)
-            
-            # Parse the classification result
-            lines = result.strip().split('\n')
-            classification = "event-related"  # default
-            confidence = 50  # default
-            reasoning = ""
-            should_respond = True
-            
-            for line in lines:
-                line_lower = line.lower()
-                if any(cat in line_lower for cat in ["event-related", "off-topic", "spam", "negative", "accessibility"]):
-                    for cat in ["event-related", "off-topic", "spam", "negative", "accessibility"]:
-                        if cat in line_lower:
-                            classification = cat
-                            break
-                elif "confidence" in line_lower:
-                    conf_match = re.search(r'(\d+)', line)
-                    if conf_match:
-                        confidence = int(conf_match.group(1))
-                elif "reasoning" in line_lower:
-                    reasoning = line.split(':')[-1].strip()
-            
-            # Determine if we should respond based on classification
-            should_respond = classification in ["event-related", "accessibility"]
-            
-            # Additional validation for spam detection
-            spam_indicators = ["buy now", "click here", "make money", "earn cash", "free money", "lottery", "winner", "urgent", "limited time"]
-            if any(indicator in comment_text.lower() for indicator in spam_indicators):
-                classification = "spam"
-                confidence = 90
-                should_respond = False
-            
-            # Additional validation for negative sentiment
-            negative_indicators = ["terrible", "awful", "horrible", "worst", "hate", "disappointed", "angry", "frustrated"]
-            if any(indicator in comment_text.lower() for indicator in negative_indicators):
-                if classification == "event-related":
-                    classification = "negative"
-                    confidence = 80
+            indicator_hits = self._find_indicators(comment_text)
+            prescreened = self._prescreen_comment(indicator_hits)
+            if prescreened is not None:
+                return prescreened
             
+            prompt = self._build_classification_prompt(comment_text, event_data)
+            result = self._call_ai(prompt, generation_config=CLASSIFICATION_GENERATION_CONFIG)
+            return self._parse_classification(result, indicator_hits)
+        except Exception as e:
+            logger.error(f"Error classifying comment: {e}")
             return {
-                "success": True,
-                "classification": classification,
-                "confidence": confidence,
-                "reasoning": reasoning,
-                "should_respond": should_respond
+                "success": False,
+                "error": str(e),
+                "classification": "event-related",
+                "should_respond": True
             }
+    
+    async def aclassify_comment(self, comment_text: str, event_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Async variant of classify_comment"""
+        try:
+            if not comment_text or not comment_text.strip():
+                return {
+                    "success": False,
+                    "error": "Empty comment text",
+                    "classification": "off-topic",
+                    "should_respond": False
+                }
+            
+            indicator_hits = self._find_indicators(comment_text)
+            prescreened = self._prescreen_comment(indicator_hits)
+            if prescreened is not None:
+                return prescreened
+            
+            prompt = self._build_classification_prompt(comment_text, event_data)
+            result = await self._acall_ai(prompt, generation_config=CLASSIFICATION_GENERATION_CONFIG)
+            return self._parse_classification(result, indicator_hits)
         except Exception as e:
             logger.error(f"Error classifying comment: {e}")
             return {
@@ -350,20 +793,39 @@ class AICommunicationAgent:
                 "should_respond": True
             }
     
+    async def classify_comments_batch(self, comments: List[str], event_data: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Classify several comments concurrently, preserving input order"""
+        semaphore = asyncio.Semaphore(AI_MAX_CONCURRENT_REQUESTS)
+        
+        async def classify(comment_text: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.aclassify_comment(comment_text, event_data)
+        
+        return await asyncio.gather(*(classify(c) for c in comments))
+    
+    def classify_comments_batch_sync(self, comments: List[str], event_data: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Blocking wrapper around classify_comments_batch for non-async callers"""
+        if not comments:
+            return []
+        return run_async(self.classify_comments_batch(comments, event_data))
+    
+    def _build_response_prompt(self, comment_text: str, classification: str, event_data: Optional[Dict[str, Any]]) -> str:
+        """Build the comment response prompt"""
+        if event_data is None:
+            event_data = {"title": "", "registration_link": "", "is_recorded": False}
+        
+        return self.response_generation_prompt.format(
+            comment_text=comment_text,
+            classification=classification,
+            event_title=event_data.get("title", ""),
+            registration_link=event_data.get("registration_link", ""),
+            is_recorded=event_data.get("is_recorded", False)
+        )
+    
     def generate_comment_response(self, comment_text: str, classification: str, event_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Generate appropriate response to a comment"""
         try:
-            if event_data is None:
-                event_data = {"title": "", "registration_link": "", "is_recorded": False}
-            
-            prompt = self.response_generation_prompt.format(
-                comment_text=comment_text,
-                classification=classification,
-                event_title=event_data.get("title", ""),
-                registration_link=event_data.get("registration_link", ""),
-                is_recorded=event_data.get("is_recorded", False)
-            )
-            
+            prompt = self._build_response_prompt(comment_text, classification, event_data)
             result = self._call_ai(prompt)
             
             return {
@@ -379,6 +841,30 @@ class AICommunicationAgent:
                 "response": "Thank you for your comment! We'll get back to you soon."
             }
     
+    def generate_comment_response_stream(self, comment_text: str, classification: str, event_data: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+        """Stream a comment response as it is generated"""
+        prompt = self._build_response_prompt(comment_text, classification, event_data)
+        return self._call_ai_stream(prompt)
+    
+    async def agenerate_comment_response(self, comment_text: str, classification: str, event_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Async variant of generate_comment_response"""
+        try:
+            prompt = self._build_response_prompt(comment_text, classification, event_data)
+            result = await self._acall_ai(prompt)
+            
+            return {
+                "success": True,
+                "response": result.strip(),
+                "classification": classification
+            }
+        except Exception as e:
+            logger.error(f"Error generating response: {e}")
+            return {
+                "success": False,
+                "error": str(e),
+                "response": "Thank you for your comment! We'll get back to you soon."
+            }
+    
     def extract_event_keywords(self, text: str) -> List[str]:
         """Extract event-related keywords from text"""
         try:
@@ -398,15 +884,50 @@ class AICommunicationAgent:
             logger.error(f"Error extracting keywords: {e}")
             return []
     
+    @staticmethod
+    def _event_catalog_fingerprint(available_events: List[Dict[str, Any]]) -> str:
+        """Hash of the event fields used for matching, so edits to the catalog miss the cache"""
+        rows = sorted(
+            tuple(str(event.get(field, "")) for field in ("EventID", "Title", "Date", "Time", "Description", "RegistrationLink"))
+            for event in available_events
+        )
+        return hashlib.sha1(repr(rows).encode("utf-8")).hexdigest()
+    
     def find_matching_event(self, user_prompt: str, available_events: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Find the most relevant event, reusing recent results for the same query and catalog"""
+        if not available_events:
+            return {"success": False, "error": "No events available"}
+        
+        cache_key = (" ".join(user_prompt.lower().split()), self._event_catalog_fingerprint(available_events))
+        with self._match_cache_lock:
+            entry = self._match_cache.get(cache_key)
+            if entry is not None and entry[0] >= time.monotonic():
+                self._match_cache.move_to_end(cache_key)
+                return dict(entry[1])
+        
+        result = self._find_matching_event_uncached(user_prompt, available_events)
+        if result.get("success"):
+            with self._match_cache_lock:
+                self._match_cache[cache_key] = (time.monotonic() + MATCH_CACHE_TTL_SECONDS, result)
+                self._match_cache.move_to_end(cache_key)
+                while len(self._match_cache) > MATCH_CACHE_MAX_ENTRIES:
+                    self._match_cache.popitem(last=False)
+            result = dict(result)
+        return result
+    
+    def _find_matching_event_uncached(self, user_prompt: str, available_events: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Intelligently find the most relevant event based on user query"""
         try:
             if not available_events:
                 return {"success": False, "error": "No events available"}
             
-            # Create a detailed prompt for event matching
+            # Create a detailed prompt for event matching, indexing events by ID as we go
             events_info = []
+            events_by_id = {}
             for i, event in enumerate(available_events):
+                event_id = event.get('EventID')
+                if event_id:
+                    events_by_id.setdefault(event_id.upper(), event)
                 event_date = event.get('Date', '')
                 event_time = event.get('Time', '')
                 if isinstance(event_date, str):
@@ -459,22 +980,22 @@ class AICommunicationAgent:
             Return only the Event ID (e.g., "EVT001") or "none":
             """
             
-            result = self._call_ai(prompt).strip()
+            result = self._call_ai(prompt, generation_config=EVENT_MATCHING_GENERATION_CONFIG).strip()
             
             # Extract event ID from result
-            event_id_match = re.search(r'EVT\d+', result, re.IGNORECASE)
+            event_id_match = _EVENT_ID_RE.search(result)
             if event_id_match:
                 event_id = event_id_match.group(0).upper()
                 # Find the matching event
-                for event in available_events:
-                    if event.get('EventID', '').upper() == event_id:
-                        logger.info(f"AI matched event: {event.get('Title', 'Unknown')} (ID: {event_id})")
-                        return {
-                            "success": True,
-                            "event": event,
-                            "confidence": 0.9,
-                            "reasoning": f"Matched based on user query context"
-                        }
+                event = events_by_id.get(event_id)
+                if event is not None:
+                    logger.info(f"AI matched event: {event.get('Title', 'Unknown')} (ID: {event_id})")
+                    return {
+                        "success": True,
+                        "event": event,
+                        "confidence": 0.9,
+                        "reasoning": f"Matched based on user query context"
+                    }
             
             # If no specific match found, try fuzzy matching
             logger.info("No specific event ID found, trying fuzzy matching...")
@@ -489,6 +1010,14 @@ class AICommunicationAgent:
         try:
             user_lower = user_prompt.lower()
             
+            # Values shared by every event, computed once
+            user_words = [word for word in user_lower.split() if len(word) > 3]
+            current_date = datetime.now().date()
+            tomorrow_date = current_date + timedelta(days=1)
+            mentions_today = "today" in user_lower
+            mentions_tomorrow = "tomorrow" in user_lower
+            mentions_this_week = "this week" in user_lower
+            
             # Score each event based on various criteria
             scored_events = []
             
@@ -501,42 +1030,24 @@ class AICommunicationAgent:
                 if title in user_lower or user_lower in title:
                     score += 100
                 
-                # Title word matches
-                title_words = title.split()
-                for word in title_words:
-                    if len(word) > 3 and word in user_lower:  # Only significant words
-                        score += 20
+                # Title word matches (only significant words)
+                score += 20 * sum(1 for word in title.split() if len(word) > 3 and word in user_lower)
                 
                 # Description matches
-                if description and any(word in description for word in user_lower.split() if len(word) > 3):
+                if description and any(word in description for word in user_words):
                     score += 10
                 
                 # Date relevance (if user mentions today/tomorrow)
                 event_date = event.get('Date')
                 if event_date:
-                    current_date = datetime.now().date()
-                    parsed_event_date = None
-                    
-                    # Handle different date formats
-                    if isinstance(event_date, str):
-                        try:
-                            parsed_event_date = datetime.strptime(event_date, "%Y-%m-%d").date()
-                        except ValueError:
-                            try:
-                                parsed_event_date = datetime.strptime(event_date, "%Y-%m-%d %H:%M:%S").date()
-                            except ValueError:
-                                parsed_event_date = None
-                    elif isinstance(event_date, date):
-                        parsed_event_date = event_date
-                    elif isinstance(event_date, datetime):
-                        parsed_event_date = event_date.date()
+                    parsed_event_date = _parse_event_date(event_date)
                     
                     if parsed_event_date:
-                        if "today" in user_lower and parsed_event_date == current_date:
+                        if mentions_today and parsed_event_date == current_date:
                             score += 50
-                        elif "tomorrow" in user_lower and parsed_event_date == current_date + timedelta(days=1):
+                        elif mentions_tomorrow and parsed_event_date == tomorrow_date:
                             score += 50
-                        elif "this week" in user_lower and (parsed_event_date - current_date).days <= 7:
+                        elif mentions_this_week and (parsed_event_date - current_date).days <= 7:
                             score += 30
                         
                         # Recency bonus (prefer recent events)
@@ -546,11 +1057,11 @@ class AICommunicationAgent:
                 
                 scored_events.append((event, score))
             
-            # Sort by score and return the best match
-            scored_events.sort(key=lambda x: x[1], reverse=True)
+            # Pick the best match (first one wins on ties)
+            best = max(scored_events, key=lambda x: x[1]) if scored_events else None
             
-            if scored_events and scored_events[0][1] > 0:
-                best_event, best_score = scored_events[0]
+            if best and best[1] > 0:
+                best_event, best_score = best
                 logger.info(f"Fuzzy matched event: {best_event.get('Title', 'Unknown')} (score: {best_score})")
                 return {
                     "success": True,
@@ -561,21 +1072,7 @@ class AICommunicationAgent:
             else:
                 # Return the most recent event as last resort
                 def get_event_date(event):
-                    event_date = event.get('Date')
-                    if isinstance(event_date, str):
-                        try:
-                            return datetime.strptime(event_date, "%Y-%m-%d").date()
-                        except ValueError:
-                            try:
-                                return datetime.strptime(event_date, "%Y-%m-%d %H:%M:%S").date()
-                            except ValueError:
-                                return datetime.min.date()
-                    elif isinstance(event_date, date):
-                        return event_date
-                    elif isinstance(event_date, datetime):
-                        return event_date.date()
-                    else:
-                        return datetime.min.date()
+                    return _parse_event_date(event.get('Date')) or date.min
                 
                 most_recent = max(available_events, key=get_event_date)
                 logger.info(f"No good match found, using most recent event: {most_recent.get('Title', 'Unknown')}")
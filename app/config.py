@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from pydantic_settings import BaseSettings
 from typing import Dict, Any
 
@@ -35,12 +36,13 @@ class Settings(BaseSettings):
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
     HOST: str = os.getenv("HOST", "0.0.0.0")
     PORT: int = int(os.getenv("PORT", "8000"))
+    RELOAD: bool = os.getenv("RELOAD", "False").lower() == "true"  # Auto-reload for local development only
     
     # Platform configurations
     PLATFORM_CONFIGS: Dict[str, Dict[str, Any]] = {
         "linkedin": {
             "tone": "professional",
-            "max_length": 500,
+            "max_length": 300,
             "hashtag_limit": 5
         },
         "twitter": {
@@ -60,4 +62,9 @@ class Settings(BaseSettings):
         env_file = ".env"
         extra = "ignore"  # Ignore extra fields from .env
 
-settings = Settings() 
\ No newline at end of file
+@lru_cache()
+def get_settings() -> Settings:
+    """Return the process-wide settings instance (parsed once)"""
+    return Settings()
+
+settings = get_settings()
@@ -1,17 +1,22 @@
 from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, Response, StreamingResponse
+from sqlalchemy import select, func, text
 from sqlalchemy.orm import Session
-from typing import List, Dict, Any, Optional
-from pydantic import BaseModel
-from datetime import datetime, date, time
+from typing import List, Dict, Any, Optional, Iterable, Iterator
+from pydantic import BaseModel, ConfigDict
+from datetime import datetime, date, time, timezone, timedelta
 import logging
-import pytz
+import threading
+import time as time_module
+import orjson
+from itertools import chain, islice
+from secrets import token_hex
 
-from app.database import get_db, create_tables, init_db
+from app.database import health_engine, get_db, create_tables, init_db, request_session_scope, session_scope
 from app.scheduler import CommunicationScheduler
 from app.ai_agent import AICommunicationAgent
-from app.models import SocialMediaPosts, SocialMediaComments, EventDetails, AIResponses
+from app.models import SocialMediaPosts, SocialMediaComments, EventDetails, AIResponses, ResponseStatus
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -21,7 +26,8 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="AI Communication Specialist",
     description="Intelligent social media content creation, scheduling, and interaction management",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -33,6 +39,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.middleware("http")
+async def db_session_middleware(request, call_next):
+    """Share one database session across the whole request"""
+    with request_session_scope():
+        return await call_next(request)
+
 # Initialize components
 scheduler = CommunicationScheduler()
 ai_agent = AICommunicationAgent()
@@ -49,6 +61,8 @@ class SchedulePostResponse(BaseModel):
     error: Optional[str] = None
 
 class PostInfo(BaseModel):
+    model_config = ConfigDict(extra="ignore", from_attributes=True)
+    
     post_id: str
     platform: str
     scheduled_time: str
@@ -57,6 +71,8 @@ class PostInfo(BaseModel):
     event_title: Optional[str]
 
 class CommentInfo(BaseModel):
+    model_config = ConfigDict(extra="ignore", from_attributes=True)
+    
     comment_id: str
     post_id: str
     platform: str
@@ -66,6 +82,8 @@ class CommentInfo(BaseModel):
     timestamp: str
 
 class EventInfo(BaseModel):
+    model_config = ConfigDict(extra="ignore", from_attributes=True)
+    
     event_id: str
     title: str
     date: str
@@ -91,13 +109,71 @@ class UpdateEventRequest(BaseModel):
     is_recorded: Optional[str] = None
 
 class AIResponseInfo(BaseModel):
+    model_config = ConfigDict(extra="ignore", from_attributes=True)
+    
     response_id: str
     trigger_type: str
     keyword_match: Optional[str]
     response_text: str
 
-# IST (Asia/Kolkata) timezone
-IST = pytz.timezone('Asia/Kolkata')
+# IST (Asia/Kolkata) timezone; fixed offset since IST has no DST
+IST = timezone(timedelta(hours=5, minutes=30), name="IST")
+IST_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S %Z%z"
+IST_TIME_FORMAT = "%H:%M:%S %Z%z"
+
+# Static / and /platforms payloads, serialized once
+ROOT_BODY = orjson.dumps({
+    "message": "AI Communication Specialist API",
+    "version": "1.0.0",
+    "status": "running"
+})
+
+PLATFORMS_BODY = orjson.dumps({
+    "platforms": [
+        {
+            "name": "LinkedIn",
+            "id": "linkedin",
+            "features": ["posts", "comments", "scheduling"]
+        },
+        {
+            "name": "Twitter/X",
+            "id": "twitter",
+            "features": ["posts", "comments", "scheduling"]
+        },
+        {
+            "name": "Dev.to",
+            "id": "devto",
+            "features": ["articles", "comments", "scheduling", "markdown"]
+        }
+    ]
+})
+
+# In-process cache of the serialized /ai-responses payload, cleared on writes
+AI_RESPONSES_CACHE_TTL = 300  # seconds
+_ai_responses_cache = {"body": None, "expires": 0.0}
+
+# Rows fetched per round-trip by streaming endpoints
+STREAM_BATCH_SIZE = 500
+
+def _stream_json_array(rows: Iterable[Dict[str, Any]], chunk_rows: int = STREAM_BATCH_SIZE) -> Iterator[bytes]:
+    """Serialize rows as a JSON array, sending one chunk per batch of rows"""
+    yield b"["
+    separator = b""
+    chunk = []
+    for row in rows:
+        chunk.append(orjson.dumps(row))
+        if len(chunk) >= chunk_rows:
+            yield separator + b",".join(chunk)
+            separator = b","
+            chunk = []
+    if chunk:
+        yield separator + b",".join(chunk)
+    yield b"]"
+
+# Cached database readiness result for health probes
+HEALTH_CHECK_TTL = 10  # seconds
+_db_health = {"ok": False, "checked": float("-inf")}
+_db_health_lock = threading.Lock()
 
 @app.on_event("startup")
 async def startup_event():
@@ -126,14 +202,10 @@ async def shutdown_event():
 @app.get("/")
 async def root():
     """Root endpoint"""
-    return {
-        "message": "AI Communication Specialist API",
-        "version": "1.0.0",
-        "status": "running"
-    }
+    return Response(content=ROOT_BODY, media_type="application/json")
 
 @app.post("/schedule-post", response_model=SchedulePostResponse)
-async def schedule_post(request: SchedulePostRequest, db: Session = Depends(get_db)):
+def schedule_post(request: SchedulePostRequest, db: Session = Depends(get_db)):
     """Schedule social media posts based on natural language prompt"""
     try:
         result = scheduler.schedule_post(request.prompt, request.platforms)
@@ -154,59 +226,75 @@ async def schedule_post(request: SchedulePostRequest, db: Session = Depends(get_
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/scheduled-posts", response_model=List[PostInfo])
-async def get_scheduled_posts(db: Session = Depends(get_db)):
+def get_scheduled_posts(db: Session = Depends(get_db)):
     """Get all scheduled posts"""
     try:
         posts = scheduler.get_scheduled_posts()
         # Convert scheduled_time to IST for all posts
-        for post in posts:
-            # If scheduled_time is a string, try to parse and convert
-            try:
-                dt = datetime.strptime(post['scheduled_time'].split(' ')[0] + ' ' + post['scheduled_time'].split(' ')[1], "%Y-%m-%d %H:%M:%S")
-                post['scheduled_time'] = IST.localize(dt).strftime("%Y-%m-%d %H:%M:%S %Z%z")
-            except Exception:
-                pass
-        return [PostInfo(**post) for post in posts]
+        return ORJSONResponse([
+            {
+                "post_id": post["post_id"],
+                "platform": post["platform"],
+                "scheduled_time": post["scheduled_dt"].replace(tzinfo=IST).strftime(IST_DATETIME_FORMAT),
+                "content_preview": post["content_preview"],
+                "campaign_tag": post["campaign_tag"],
+                "event_title": post["event_title"]
+            }
+            for post in posts
+        ])
     except Exception as e:
         logger.error(f"Error getting scheduled posts: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/pending-comments", response_model=List[CommentInfo])
-async def get_pending_comments(db: Session = Depends(get_db)):
+@app.get("/pending-comments")
+def get_pending_comments():
     """Get all pending comments that need human review"""
     try:
-        comments = scheduler.get_pending_comments()
-        return [CommentInfo(**comment) for comment in comments]
+        rows = scheduler.iter_pending_comments(batch_size=STREAM_BATCH_SIZE)
+        # Run the query and read the first batch here, so database errors become a 500
+        # instead of a truncated 200 body once streaming has started
+        first_batch = list(islice(rows, STREAM_BATCH_SIZE))
+        return StreamingResponse(
+            _stream_json_array(chain(first_batch, rows)),
+            media_type="application/json"
+        )
     except Exception as e:
         logger.error(f"Error getting pending comments: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/events", response_model=List[EventInfo])
-async def get_events(days_ahead: int = 30, db: Session = Depends(get_db)):
+def get_events(days_ahead: int = 30, db: Session = Depends(get_db)):
     """Get events from database"""
     try:
-        events = db.query(EventDetails).all()
-        result = []
-        for event in events:
-            # Format date and time in IST
-            dt = datetime.combine(event.Date, event.Time)
-            dt_ist = IST.localize(dt)
-            result.append(EventInfo(
-                event_id=event.EventID,
-                title=event.Title,
-                date=dt_ist.strftime("%Y-%m-%d %H:%M:%S %Z%z"),
-                time=dt_ist.strftime("%H:%M:%S %Z%z"),
-                description=event.Description or "",
-                registration_link=event.RegistrationLink,
-                is_recorded=event.IsRecorded or "No"
-            ))
-        return result
+        events = db.query(EventDetails).with_entities(
+            EventDetails.EventID,
+            EventDetails.Title,
+            EventDetails.Date,
+            EventDetails.Time,
+            EventDetails.Description,
+            EventDetails.RegistrationLink,
+            EventDetails.IsRecorded,
+        ).all()
+        # Format date and time in IST
+        localized = [(event, datetime.combine(event.Date, event.Time, tzinfo=IST)) for event in events]
+        return ORJSONResponse([
+            {
+                "event_id": event.EventID,
+                "title": event.Title,
+                "date": dt_ist.strftime(IST_DATETIME_FORMAT),
+                "time": dt_ist.strftime(IST_TIME_FORMAT),
+                "description": event.Description or "",
+                "registration_link": event.RegistrationLink,
+                "is_recorded": event.IsRecorded or "No"
+            }
+            for event, dt_ist in localized
+        ])
     except Exception as e:
         logger.error(f"Error getting events: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/events/{event_id}", response_model=EventInfo)
-async def get_event(event_id: str, db: Session = Depends(get_db)):
+def get_event(event_id: str, db: Session = Depends(get_db)):
     """Get a specific event by ID"""
     try:
         event = db.query(EventDetails).filter(EventDetails.EventID == event_id).first()
@@ -215,12 +303,12 @@ async def get_event(event_id: str, db: Session = Depends(get_db)):
         
         # Format date and time in IST
         dt = datetime.combine(event.Date, event.Time)
-        dt_ist = IST.localize(dt)
-        return EventInfo(
+        dt_ist = dt.replace(tzinfo=IST)
+        return EventInfo.model_construct(
             event_id=event.EventID,
             title=event.Title,
-            date=dt_ist.strftime("%Y-%m-%d %H:%M:%S %Z%z"),
-            time=dt_ist.strftime("%H:%M:%S %Z%z"),
+            date=dt_ist.strftime(IST_DATETIME_FORMAT),
+            time=dt_ist.strftime(IST_TIME_FORMAT),
             description=event.Description or "",
             registration_link=event.RegistrationLink,
             is_recorded=event.IsRecorded or "No"
@@ -232,12 +320,11 @@ async def get_event(event_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/events", response_model=EventInfo)
-async def create_event(request: CreateEventRequest, db: Session = Depends(get_db)):
+def create_event(request: CreateEventRequest, db: Session = Depends(get_db)):
     """Create a new event"""
     try:
         # Generate a unique EventID
-        import uuid
-        event_id = f"EVT{uuid.uuid4().hex[:7].upper()}"
+        event_id = f"EVT{token_hex(4)[:7].upper()}"
         
         # Parse date and time
         event_date = datetime.strptime(request.date, "%Y-%m-%d").date()
@@ -257,15 +344,16 @@ async def create_event(request: CreateEventRequest, db: Session = Depends(get_db
         db.add(new_event)
         db.commit()
         db.refresh(new_event)
+        scheduler.invalidate_events_cache()
         
         # Format response
         dt = datetime.combine(new_event.Date, new_event.Time)
-        dt_ist = IST.localize(dt)
-        return EventInfo(
+        dt_ist = dt.replace(tzinfo=IST)
+        return EventInfo.model_construct(
             event_id=new_event.EventID,
             title=new_event.Title,
-            date=dt_ist.strftime("%Y-%m-%d %H:%M:%S %Z%z"),
-            time=dt_ist.strftime("%H:%M:%S %Z%z"),
+            date=dt_ist.strftime(IST_DATETIME_FORMAT),
+            time=dt_ist.strftime(IST_TIME_FORMAT),
             description=new_event.Description or "",
             registration_link=new_event.RegistrationLink,
             is_recorded=new_event.IsRecorded or "No"
@@ -278,7 +366,7 @@ async def create_event(request: CreateEventRequest, db: Session = Depends(get_db
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.put("/events/{event_id}", response_model=EventInfo)
-async def update_event(event_id: str, request: UpdateEventRequest, db: Session = Depends(get_db)):
+def update_event(event_id: str, request: UpdateEventRequest, db: Session = Depends(get_db)):
     """Update an existing event"""
     try:
         event = db.query(EventDetails).filter(EventDetails.EventID == event_id).first()
@@ -301,15 +389,16 @@ async def update_event(event_id: str, request: UpdateEventRequest, db: Session =
         
         db.commit()
         db.refresh(event)
+        scheduler.invalidate_events_cache()
         
         # Format response
         dt = datetime.combine(event.Date, event.Time)
-        dt_ist = IST.localize(dt)
-        return EventInfo(
+        dt_ist = dt.replace(tzinfo=IST)
+        return EventInfo.model_construct(
             event_id=event.EventID,
             title=event.Title,
-            date=dt_ist.strftime("%Y-%m-%d %H:%M:%S %Z%z"),
-            time=dt_ist.strftime("%H:%M:%S %Z%z"),
+            date=dt_ist.strftime(IST_DATETIME_FORMAT),
+            time=dt_ist.strftime(IST_TIME_FORMAT),
             description=event.Description or "",
             registration_link=event.RegistrationLink,
             is_recorded=event.IsRecorded or "No"
@@ -324,7 +413,7 @@ async def update_event(event_id: str, request: UpdateEventRequest, db: Session =
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.delete("/events/{event_id}")
-async def delete_event(event_id: str, db: Session = Depends(get_db)):
+def delete_event(event_id: str, db: Session = Depends(get_db)):
     """Delete an event"""
     try:
         event = db.query(EventDetails).filter(EventDetails.EventID == event_id).first()
@@ -332,7 +421,7 @@ async def delete_event(event_id: str, db: Session = Depends(get_db)):
             raise HTTPException(status_code=404, detail="Event not found")
         
         # Check if event has associated posts
-        associated_posts = db.query(SocialMediaPosts).filter(SocialMediaPosts.EventID == event_id).count()
+        associated_posts = db.query(func.count(SocialMediaPosts.PostID)).filter(SocialMediaPosts.EventID == event_id).scalar()
         if associated_posts > 0:
             raise HTTPException(
                 status_code=400, 
@@ -341,6 +430,7 @@ async def delete_event(event_id: str, db: Session = Depends(get_db)):
         
         db.delete(event)
         db.commit()
+        scheduler.invalidate_events_cache()
         
         return {"message": "Event deleted successfully"}
     except HTTPException:
@@ -351,27 +441,37 @@ async def delete_event(event_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/ai-responses", response_model=List[AIResponseInfo])
-async def get_ai_responses(db: Session = Depends(get_db)):
+def get_ai_responses(db: Session = Depends(get_db)):
     """Get all AI response templates"""
     try:
-        responses = db.query(AIResponses).all()
-        
-        result = []
-        for response in responses:
-            result.append(AIResponseInfo(
-                response_id=response.ResponseID,
-                trigger_type=response.TriggerType,
-                keyword_match=response.KeywordMatch,
-                response_text=response.ResponseText
-            ))
+        now = time_module.monotonic()
+        if _ai_responses_cache["body"] is None or now >= _ai_responses_cache["expires"]:
+            responses = db.query(AIResponses).with_entities(
+                AIResponses.ResponseID,
+                AIResponses.TriggerType,
+                AIResponses.KeywordMatch,
+                AIResponses.ResponseText,
+            ).all()
+            
+            result = []
+            for response in responses:
+                result.append(AIResponseInfo.model_construct(
+                    response_id=response.ResponseID,
+                    trigger_type=response.TriggerType,
+                    keyword_match=response.KeywordMatch,
+                    response_text=response.ResponseText
+                ).model_dump())
+            
+            _ai_responses_cache["body"] = orjson.dumps(result)
+            _ai_responses_cache["expires"] = now + AI_RESPONSES_CACHE_TTL
         
-        return result
+        return Response(content=_ai_responses_cache["body"], media_type="application/json")
     except Exception as e:
         logger.error(f"Error getting AI responses: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/ai-responses")
-async def create_ai_response(
+def create_ai_response(
     trigger_type: str,
     response_text: str,
     keyword_match: Optional[str] = None,
@@ -379,8 +479,7 @@ async def create_ai_response(
 ):
     """Create a new AI response template"""
     try:
-        import uuid
-        response_id = f"RESP{str(uuid.uuid4())[:8].upper()}"
+        response_id = f"RESP{token_hex(4).upper()}"
         
         new_response = AIResponses(
             ResponseID=response_id,
@@ -391,6 +490,7 @@ async def create_ai_response(
         
         db.add(new_response)
         db.commit()
+        _ai_responses_cache["body"] = None
         
         return {"success": True, "response_id": response_id}
     except Exception as e:
@@ -401,70 +501,79 @@ async def create_ai_response(
 @app.get("/platforms")
 async def get_platforms():
     """Get supported social media platforms"""
+    return Response(content=PLATFORMS_BODY, media_type="application/json")
+
+def _database_ready() -> bool:
+    """Check database connectivity, reusing the result for HEALTH_CHECK_TTL seconds"""
+    now = time_module.monotonic()
+    if now - _db_health["checked"] < HEALTH_CHECK_TTL:
+        return _db_health["ok"]
+    # One probe per TTL: concurrent callers reuse the last result instead of connecting too
+    # (they only wait for the very first probe, when there is no result yet)
+    if not _db_health_lock.acquire(blocking=_db_health["checked"] == float("-inf")):
+        return _db_health["ok"]
+    try:
+        if now - _db_health["checked"] >= HEALTH_CHECK_TTL:
+            try:
+                with health_engine.connect() as conn:
+                    conn.execute(text("SELECT 1"))
+                _db_health["ok"] = True
+            except Exception as e:
+                logger.error(f"Database readiness check failed: {e}")
+                _db_health["ok"] = False
+            _db_health["checked"] = time_module.monotonic()
+    finally:
+        _db_health_lock.release()
+    return _db_health["ok"]
+
+@app.get("/health/live")
+async def liveness_check():
+    """Liveness probe; does not touch the database"""
     return {
-        "platforms": [
-            {
-                "name": "LinkedIn",
-                "id": "linkedin",
-                "features": ["posts", "comments", "scheduling"]
-            },
-            {
-                "name": "Twitter/X",
-                "id": "twitter",
-                "features": ["posts", "comments", "scheduling"]
-            },
-            {
-                "name": "Dev.to",
-                "id": "devto",
-                "features": ["articles", "comments", "scheduling", "markdown"]
-            }
-        ]
+        "status": "alive",
+        "timestamp": datetime.now(IST).strftime(IST_DATETIME_FORMAT)
     }
 
 @app.get("/health")
-async def health_check():
+@app.get("/health/ready")
+def health_check():
     """Health check endpoint"""
-    try:
-        # Test database connection
-        db = next(get_db())
-        db.execute("SELECT 1")
-        db.close()
-        return {
-            "status": "healthy",
-            "database": "connected",
-            "timestamp": datetime.now(IST).strftime("%Y-%m-%d %H:%M:%S %Z%z")
-        }
-    except Exception as e:
-        logger.error(f"Health check failed: {e}")
+    if not _database_ready():
         raise HTTPException(status_code=503, detail="Service unhealthy")
+    return {
+        "status": "healthy",
+        "database": "connected",
+        "timestamp": datetime.now(IST).strftime(IST_DATETIME_FORMAT)
+    }
 
 @app.get("/stats")
-async def get_stats(db: Session = Depends(get_db)):
+def get_stats(db: Session = Depends(get_db)):
     """Get system statistics"""
     try:
-        # Get counts from database
-        post_count = db.query(SocialMediaPosts).count()
-        comment_count = db.query(SocialMediaComments).count()
-        event_count = db.query(EventDetails).count()
-        response_count = db.query(AIResponses).count()
-        # Get pending comments count
-        pending_comments = db.query(SocialMediaComments).filter(
-            SocialMediaComments.ResponseStatus == "Pending"
-        ).count()
+        # Get all counts from database in a single round-trip
+        counts = db.execute(select(
+            select(func.count()).select_from(SocialMediaPosts).scalar_subquery().label("posts"),
+            select(func.count()).select_from(SocialMediaComments).scalar_subquery().label("comments"),
+            select(func.count()).select_from(SocialMediaComments).where(
+                SocialMediaComments.ResponseStatus == ResponseStatus.PENDING
+            ).scalar_subquery().label("pending"),
+            select(func.count()).select_from(EventDetails).scalar_subquery().label("events"),
+            select(func.count()).select_from(AIResponses).scalar_subquery().label("responses"),
+        )).one()
         return {
-            "total_posts": post_count,
-            "total_comments": comment_count,
-            "pending_comments": pending_comments,
-            "total_events": event_count,
-            "ai_responses": response_count,
-            "last_updated": datetime.now(IST).strftime("%Y-%m-%d %H:%M:%S %Z%z")
+            "total_posts": counts.posts,
+            "total_comments": counts.comments,
+            "pending_comments": counts.pending,
+            "total_events": counts.events,
+            "ai_responses": counts.responses,
+            "last_updated": datetime.now(IST).strftime(IST_DATETIME_FORMAT)
         }
     except Exception as e:
         logger.error(f"Error getting stats: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/trigger-comment-monitoring")
-async def trigger_comment_monitoring(post_id: str, platform: str):
+def trigger_comment_monitoring(post_id: str, platform: str):
     """Manually trigger comment monitoring for a specific post"""
     try:
         result = scheduler.trigger_comment_monitoring(post_id, platform)
@@ -477,7 +586,7 @@ async def trigger_comment_monitoring(post_id: str, platform: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/comment-stats")
-async def get_comment_stats():
+def get_comment_stats():
     """Get detailed comment statistics"""
     try:
         result = scheduler.get_comment_stats()
@@ -494,7 +603,7 @@ class EditPostRequest(BaseModel):
     new_time: Optional[str] = None  # ISO format datetime string
 
 @app.put("/scheduled-posts/{post_id}")
-async def edit_scheduled_post(post_id: str, request: EditPostRequest):
+def edit_scheduled_post(post_id: str, request: EditPostRequest):
     """Edit a scheduled post's content and/or time"""
     try:
         new_time = None
@@ -515,7 +624,7 @@ async def edit_scheduled_post(post_id: str, request: EditPostRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.delete("/scheduled-posts/{post_id}")
-async def cancel_scheduled_post(post_id: str, platform: str):
+def cancel_scheduled_post(post_id: str, platform: str):
     """Cancel a scheduled post"""
     try:
         result = scheduler.cancel_scheduled_post(post_id, platform)
@@ -528,33 +637,57 @@ async def cancel_scheduled_post(post_id: str, platform: str):
         logger.error(f"Error cancelling scheduled post: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+def _iter_debug_posts():
+    """Yield /debug/posts rows from their own session, one fetch batch at a time"""
+    with session_scope() as db:
+        # Fetch only the columns needed, with previews truncated server-side
+        posts = db.query(
+            SocialMediaPosts.PostID,
+            SocialMediaPosts.Platform,
+            SocialMediaPosts.Status,
+            SocialMediaPosts.PostDate,
+            SocialMediaPosts.PostTime,
+            EventDetails.Title,
+            func.substring(SocialMediaPosts.ContentPreview, 1, 100),
+        ).outerjoin(SocialMediaPosts.event).execution_options(stream_results=True).yield_per(STREAM_BATCH_SIZE)
+        
+        for post_id, platform, status, post_date, post_time, event_title, preview in posts:
+            yield {
+                "post_id": post_id,
+                "platform": platform,
+                "status": status,
+                "scheduled_time": f"{post_date} {post_time}" if post_date and post_time else None,
+                "event_title": event_title,
+                "content_preview": preview + "..." if preview else None
+            }
+
 @app.get("/debug/posts")
-async def debug_posts(db: Session = Depends(get_db)):
+def debug_posts(db: Session = Depends(get_db)):
     """Debug endpoint to check all posts and their statuses"""
     try:
-        from app.models import SocialMediaPosts
-        posts = db.query(SocialMediaPosts).all()
+        status_counts = {"Scheduled": 0, "Cancelled": 0, "Published": 0, "Failed": 0}
+        # Status is a nullable Enum column; orjson only accepts str keys
+        status_counts.update(
+            (status.value if status else "unknown", count)
+            for status, count in db.query(SocialMediaPosts.Status, func.count()).group_by(SocialMediaPosts.Status)
+        )
+        # Serialized up front so a failure here is a 500, not a truncated body
+        status_counts_json = orjson.dumps(status_counts)
         
-        result = []
-        for post in posts:
-            result.append({
-                "post_id": post.PostID,
-                "platform": post.Platform,
-                "status": post.Status,
-                "scheduled_time": f"{post.PostDate} {post.PostTime}" if post.PostDate and post.PostTime else None,
-                "content_preview": post.ContentPreview[:100] + "..." if post.ContentPreview else None
-            })
+        # Run the query and read the first batch here, so database errors become a 500
+        # instead of a truncated 200 body once streaming has started
+        posts = _iter_debug_posts()
+        first_batch = list(islice(posts, STREAM_BATCH_SIZE))
         
-        return {
-            "total_posts": len(result),
-            "posts": result,
-            "status_counts": {
-                "Scheduled": len([p for p in result if p["status"] == "Scheduled"]),
-                "Cancelled": len([p for p in result if p["status"] == "Cancelled"]),
-                "Published": len([p for p in result if p["status"] == "Published"]),
-                "Failed": len([p for p in result if p["status"] == "Failed"])
-            }
-        }
+        def body():
+            total = 0
+            yield b'{"posts":['
+            for post in chain(first_batch, posts):
+                yield (b"," if total else b"") + orjson.dumps(post)
+                total += 1
+            yield b'],"total_posts":' + orjson.dumps(total) + b',"status_counts":' + status_counts_json + b"}"
+        
+        return StreamingResponse(body(), media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
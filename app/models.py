@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Enum, Date, Time
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Enum, Date, Time, Index, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -6,24 +6,35 @@ import enum
 
 Base = declarative_base()
 
-class PostStatus(enum.Enum):
-    DRAFT = "draft"
-    SCHEDULED = "scheduled"
-    PUBLISHED = "published"
-    FAILED = "failed"
+class _StrEnum(str, enum.Enum):
+    """Enum whose members compare and print as their stored string value"""
+    def __str__(self):
+        return self.value
 
-class ResponseStatus(enum.Enum):
-    PENDING = "pending"
-    RESPONDED = "responded"
-    ESCALATED = "escalated"
+class PostStatus(_StrEnum):
+    DRAFT = "Draft"
+    SCHEDULED = "Scheduled"
+    PUBLISHED = "Published"
+    CANCELLED = "Cancelled"
+    FAILED = "Failed"
 
-class CommentClassification(enum.Enum):
+class ResponseStatus(_StrEnum):
+    PENDING = "Pending"
+    RESPONDED = "Responded"
+    ESCALATED = "Escalated"
+    FAILED = "Failed"
+
+class CommentClassification(_StrEnum):
     EVENT_RELATED = "event-related"
     OFF_TOPIC = "off-topic"
     SPAM = "spam"
     NEGATIVE = "negative"
     ACCESSIBILITY = "accessibility"
 
+def _enum_type(enum_cls):
+    """Short VARCHAR-backed enum storing member values, compatible with existing rows"""
+    return Enum(enum_cls, native_enum=False, length=16, values_callable=lambda e: [m.value for m in e])
+
 class EventDetails(Base):
     __tablename__ = "EventDetails"
     
@@ -40,14 +51,17 @@ class EventDetails(Base):
 
 class SocialMediaPosts(Base):
     __tablename__ = "SocialMediaPosts"
+    __table_args__ = (
+        Index("ix_posts_plat_status_date", "Platform", "Status", "PostDate"),
+    )
     
     PostID = Column(String(10), primary_key=True)
-    Platform = Column(String(100), nullable=False)  # linkedin, facebook, twitter, instagram
-    PostDate = Column(Date, nullable=False)
+    Platform = Column(String(100), nullable=False, index=True)  # linkedin, facebook, twitter, instagram
+    PostDate = Column(Date, nullable=False, index=True)
     PostTime = Column(Time, nullable=False)
     ContentPreview = Column(String(4000), nullable=True)
     CampaignTag = Column(String(100), nullable=True)
-    Status = Column(String(50), default="Scheduled")
+    Status = Column(_enum_type(PostStatus), default=PostStatus.SCHEDULED, index=True)
     EventID = Column(String(10), ForeignKey("EventDetails.EventID"), nullable=True)
     PlatformPostID = Column(String(100), nullable=True)  # Real post/article/tweet ID from the platform
     
@@ -57,14 +71,24 @@ class SocialMediaPosts(Base):
 
 class SocialMediaComments(Base):
     __tablename__ = "SocialMediaComments"
+    __table_args__ = (
+        # Filtered index over the small Pending slice that the review queue reads
+        Index(
+            "ix_comments_pending",
+            "CommentID",
+            mssql_where=text("ResponseStatus = 'Pending'"),
+            postgresql_where=text("\"ResponseStatus\" = 'Pending'"),
+            sqlite_where=text("ResponseStatus = 'Pending'")
+        ),
+    )
     
     CommentID = Column(String(10), primary_key=True)
     PostID = Column(String(10), ForeignKey("SocialMediaPosts.PostID"), nullable=True)
     UserName = Column(String(100), nullable=True)
     CommentText = Column(Text, nullable=True)
-    Timestamp = Column(DateTime, default=datetime.utcnow)
-    ResponseStatus = Column(String(50), default="Pending")
-    Classification = Column(String(100), nullable=True)
+    Timestamp = Column(DateTime, default=datetime.utcnow, index=True)
+    ResponseStatus = Column(_enum_type(ResponseStatus), default=ResponseStatus.PENDING, index=True)
+    Classification = Column(_enum_type(CommentClassification), nullable=True)
     RetryCount = Column(Integer, default=0)
     
     # Relationships
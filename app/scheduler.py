@@ -1,45 +1,128 @@
 from apscheduler.schedulers.background import BackgroundScheduler
-from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.triggers.date import DateTrigger
 from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.executors.pool import ThreadPoolExecutor
-from app.database import SessionLocal
-from app.models import SocialMediaPosts, SocialMediaComments, EventDetails, AuditLog, AIResponses
-from app.ai_agent import AICommunicationAgent
+from app.database import session_scope
+from sqlalchemy import select, insert, update, literal, func, bindparam
+from sqlalchemy.orm import Session, joinedload, selectinload
+from app.models import SocialMediaPosts, SocialMediaComments, EventDetails, AuditLog, AIResponses, ResponseStatus
+from app.ai_agent import AICommunicationAgent, AI_MAX_CONCURRENT_REQUESTS, run_async
 from app.social_media_platforms import SocialMediaManager
-from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta, date, time
+from typing import Dict, List, Optional, Any, Iterator
+from collections import OrderedDict
+from datetime import datetime, timedelta, date, time, timezone
+from zoneinfo import ZoneInfo
+import asyncio
+import concurrent.futures
 import logging
-import uuid
+import queue
+import re
+import threading
 import os
+from time import monotonic
 from dotenv import load_dotenv
-import pytz
-from bs4 import BeautifulSoup
+from html import unescape
+from secrets import token_hex
 
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
-IST = pytz.timezone('Asia/Kolkata')
+IST = ZoneInfo('Asia/Kolkata')
+
+# How long the event catalog used for matching is reused before re-reading it
+EVENTS_CACHE_TTL_SECONDS = int(os.getenv("EVENTS_CACHE_TTL_SECONDS", 60))
+
+# Platform clients are blocking; replies to one batch of comments fan out over this pool
+COMMENT_REPLY_MAX_WORKERS = int(os.getenv("COMMENT_REPLY_MAX_WORKERS", 8))
+_comment_reply_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=COMMENT_REPLY_MAX_WORKERS,
+    thread_name_prefix="comment-reply"
+)
+
+# Platforms whose pending jobs are removed by cleanup_disabled_platform_jobs
+DISABLED_PLATFORMS = frozenset({"linkedin"})
+
+# PostID/platform -> PlatformPostID never changes once a post is published
+PLATFORM_POST_ID_CACHE_MAX_ENTRIES = 1024
+# Posts whose comment monitoring cursor is kept (least recently used are dropped first)
+MONITOR_CURSOR_MAX_ENTRIES = 1024
+
+# Audit logs are written behind the request by a background thread, in batches
+AUDIT_FLUSH_INTERVAL_SECONDS = 1.0
+AUDIT_FLUSH_BATCH_SIZE = 200
+
+# Comment bodies only need tags stripped and whitespace collapsed
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+
+# Statements for the hot read paths, built once; SQLAlchemy reuses their compiled form
+_PENDING_COMMENTS_STMT = select(
+    SocialMediaComments.CommentID,
+    SocialMediaComments.PostID,
+    SocialMediaPosts.Platform,
+    SocialMediaComments.UserName,
+    SocialMediaComments.CommentText,
+    SocialMediaComments.Classification,
+    SocialMediaComments.Timestamp
+).outerjoin(SocialMediaComments.post).where(SocialMediaComments.ResponseStatus == ResponseStatus.PENDING)
+
+_COMMENT_STATUS_COUNTS_STMT = select(
+    SocialMediaComments.ResponseStatus, func.count(SocialMediaComments.CommentID)
+).group_by(SocialMediaComments.ResponseStatus)
+
+_COMMENT_CLASSIFICATION_COUNTS_STMT = select(
+    SocialMediaComments.Classification, func.count(SocialMediaComments.CommentID)
+).group_by(SocialMediaComments.Classification)
+
+_PLATFORM_POST_ID_STMT = select(SocialMediaPosts.PlatformPostID).where(
+    SocialMediaPosts.PostID == bindparam("post_id"),
+    SocialMediaPosts.Platform == bindparam("platform")
+)
 
 # --- TOP-LEVEL FUNCTION FOR APSCHEDULER JOBS ---
 def publish_scheduled_post(post_id: str, platform: str):
     """Top-level function for APScheduler to call for publishing posts."""
     from app.scheduler import CommunicationScheduler
-    scheduler = CommunicationScheduler()
-    scheduler._publish_scheduled_post(post_id, platform)
+    CommunicationScheduler.instance()._publish_scheduled_post(post_id, platform)
 
 # --- TOP-LEVEL FUNCTION FOR COMMENT MONITORING JOB ---
 def monitor_comments_job(post_id, platform, platform_post_id):
     """Top-level function for APScheduler to call for monitoring comments."""
     from app.scheduler import CommunicationScheduler
-    scheduler = CommunicationScheduler()
+    scheduler = CommunicationScheduler.instance()
     scheduler._monitor_comments(post_id, platform, platform_post_id)
+    # APScheduler drops an interval job before its final run; the window is over, so is the cursor
+    if scheduler.scheduler.get_job(f"monitor_{post_id}_{platform}") is None:
+        scheduler._forget_monitor_cursor(post_id, platform)
 
 class CommunicationScheduler:
     """Main scheduler for managing social media posts and comment monitoring"""
     
+    # Process-wide singleton; constructing the class again returns the same instance
+    _instance: Optional["CommunicationScheduler"] = None
+    _instance_lock = threading.RLock()
+    
+    def __new__(cls):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+            return cls._instance
+    
+    @classmethod
+    def instance(cls) -> "CommunicationScheduler":
+        """Return the process-wide scheduler, creating it on first use"""
+        return cls()
+    
     def __init__(self):
+        with CommunicationScheduler._instance_lock:
+            if getattr(self, "_initialized", False):
+                return
+            self._initialize()
+            self._initialized = True
+    
+    def _initialize(self):
         """Initialize the scheduler with job stores and executors"""
         # Use SQL Server connection string for job store
         DATABASE_URL = os.getenv(
@@ -52,21 +135,46 @@ class CommunicationScheduler:
                 'default': SQLAlchemyJobStore(url=DATABASE_URL)
             },
             executors={
-                'default': ThreadPoolExecutor(5)  # Reduced from 20 to 5 to prevent connection conflicts
+                'default': ThreadPoolExecutor(5),  # Jobs persisted before the pools were split
+                'publish': ThreadPoolExecutor(5),  # Time-critical publishing
+                'monitor': ThreadPoolExecutor(20)  # I/O-heavy comment polling
             },
             job_defaults={
                 'coalesce': True,  # Combine multiple pending jobs of the same type
                 'max_instances': 1,  # Only allow 1 instance of each job
-                'misfire_grace_time': 60  # Grace period for misfired jobs
+                'misfire_grace_time': 300  # Grace period for misfired jobs
             }
         )
         
         self.ai_agent = AICommunicationAgent()
         self.social_media_manager = SocialMediaManager()
+        self.reload_platforms()
+        
+        # Write-behind queue for audit logs, drained by _audit_writer
+        self._audit_queue: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        self._audit_flush_lock = threading.Lock()
+        self._audit_wakeup = threading.Event()
+        self._audit_stop = threading.Event()
+        self._audit_thread = threading.Thread(target=self._audit_writer, name="audit-log-writer", daemon=True)
+        self._audit_thread.start()
+        
+        # Published posts' platform IDs, see _get_platform_post_id()
+        self._platform_post_ids: "OrderedDict[tuple, str]" = OrderedDict()
+        self._platform_post_ids_lock = threading.Lock()
+        
+        # Comment IDs seen on the last fully handled monitoring tick, per (post_id, platform)
+        self._monitor_cursors: "OrderedDict[tuple, frozenset]" = OrderedDict()
+        self._monitor_cursors_lock = threading.Lock()
+        
+        # Event catalog cache for schedule_post, see invalidate_events_cache()
+        self._events_cache = None
+        self._events_cache_ts = 0.0
+        self._events_cache_ttl = EVENTS_CACHE_TTL_SECONDS
         
         # Start the scheduler
-        self.scheduler.start()
-        logger.info("Communication scheduler started")
+        if not self.scheduler.running:
+            self.scheduler.start()
+            logger.info("Communication scheduler started")
     
     def schedule_post(self, user_prompt: str, platforms: List[str] = None) -> Dict[str, Any]:
         """Schedule posts based on user prompt"""
@@ -82,22 +190,69 @@ class CommunicationScheduler:
             logger.info(f"AI parsed datetime (UTC): {scheduled_time}")
             
             if scheduled_time.tzinfo is None:
-                scheduled_time = pytz.utc.localize(scheduled_time)
+                scheduled_time = scheduled_time.replace(tzinfo=timezone.utc)
             scheduled_time_ist = scheduled_time.astimezone(IST)
+            scheduled_time_str = scheduled_time_ist.strftime("%Y-%m-%d %H:%M:%S %Z%z")
             logger.info(f"Converted to IST: {scheduled_time_ist}")
             
             if is_immediate:
                 logger.info("Scheduling immediate post (within 2 minutes)")
             
-            # Get all available events from database
-            db = SessionLocal()
-            try:
-                all_events = db.query(EventDetails).order_by(EventDetails.Date.desc()).all()
-                if not all_events:
-                    db.close()
+            with session_scope() as db:
+                # Get all available events from database
+                try:
+                    available_events = self._get_available_events(db)
+                    if not available_events:
+                        return {
+                            "success": False, 
+                            "error": "No events found in the database. Please add some events first.",
+                            "scheduled_posts": {},
+                            "event": {
+                                "title": "Error",
+                                "date": "",
+                                "description": ""
+                            }
+                        }
+                    
+                    # Use AI to find the most relevant event based on user query
+                    event_match_result = self.ai_agent.find_matching_event(user_prompt, available_events)
+                    
+                    if not event_match_result["success"]:
+                        return {
+                            "success": False, 
+                            "error": f"Failed to match event: {event_match_result.get('error', 'Unknown error')}",
+                            "scheduled_posts": {},
+                            "event": {
+                                "title": "Error",
+                                "date": "",
+                                "description": ""
+                            }
+                        }
+                    
+                    matched_event = event_match_result["event"]
+                    confidence = event_match_result.get("confidence", 0.5)
+                    reasoning = event_match_result.get("reasoning", "Unknown")
+                    
+                    logger.info(f"Event matched: {matched_event['Title']} (confidence: {confidence:.2f}, reasoning: {reasoning})")
+                    
+                    # If confidence is low, warn the user but proceed
+                    if confidence < 0.5:
+                        logger.warning(f"Low confidence event match ({confidence:.2f}): {matched_event['Title']}")
+                    
+                    event_data = {
+                        "id": matched_event["EventID"],
+                        "title": matched_event["Title"],
+                        "description": matched_event["Description"],
+                        "start_date": datetime.combine(matched_event["Date"], matched_event["Time"]).replace(tzinfo=IST),
+                        "time": matched_event["Time"].strftime("%H:%M:%S"),
+                        "html_link": matched_event["RegistrationLink"]
+                    }
+                    
+                except Exception as e:
+                    logger.error(f"Database error in event matching: {e}")
                     return {
                         "success": False, 
-                        "error": "No events found in the database. Please add some events first.",
+                        "error": f"Database error: {str(e)}",
                         "scheduled_posts": {},
                         "event": {
                             "title": "Error",
@@ -106,26 +261,20 @@ class CommunicationScheduler:
                         }
                     }
                 
-                # Convert events to dictionary format for AI processing
-                available_events = []
-                for event in all_events:
-                    available_events.append({
-                        'EventID': event.EventID,
-                        'Title': event.Title,
-                        'Description': event.Description or "",
-                        'Date': event.Date,
-                        'Time': event.Time,
-                        'RegistrationLink': event.RegistrationLink or ""
-                    })
+                # End the read transaction so no connection is held during content generation
+                db.commit()
                 
-                # Use AI to find the most relevant event based on user query
-                event_match_result = self.ai_agent.find_matching_event(user_prompt, available_events)
+                # Generate platform-specific content
+                if platforms is None:
+                    platforms = ["devto"]  # Only Dev.to for now
                 
-                if not event_match_result["success"]:
-                    db.close()
+                # Filter out platforms that are not available
+                platforms = [p for p in platforms if p in self._available_platforms]
+                
+                if not platforms:
                     return {
                         "success": False, 
-                        "error": f"Failed to match event: {event_match_result.get('error', 'Unknown error')}",
+                        "error": "No available platforms found. Please check your platform configuration.",
                         "scheduled_posts": {},
                         "event": {
                             "title": "Error",
@@ -134,100 +283,53 @@ class CommunicationScheduler:
                         }
                     }
                 
-                matched_event = event_match_result["event"]
-                confidence = event_match_result.get("confidence", 0.5)
-                reasoning = event_match_result.get("reasoning", "Unknown")
-                
-                logger.info(f"Event matched: {matched_event['Title']} (confidence: {confidence:.2f}, reasoning: {reasoning})")
-                
-                # If confidence is low, warn the user but proceed
-                if confidence < 0.5:
-                    logger.warning(f"Low confidence event match ({confidence:.2f}): {matched_event['Title']}")
+                scheduled_posts = {}
                 
-                event_data = {
-                    "id": matched_event["EventID"],
-                    "title": matched_event["Title"],
-                    "description": matched_event["Description"],
-                    "start_date": datetime.combine(matched_event["Date"], matched_event["Time"]).replace(tzinfo=IST),
-                    "time": matched_event["Time"].strftime("%H:%M:%S"),
-                    "html_link": matched_event["RegistrationLink"]
-                }
-                
-            except Exception as e:
-                db.close()
-                logger.error(f"Database error in event matching: {e}")
-                return {
-                    "success": False, 
-                    "error": f"Database error: {str(e)}",
-                    "scheduled_posts": {},
-                    "event": {
-                        "title": "Error",
-                        "date": "",
-                        "description": ""
-                    }
-                }
-            finally:
-                db.close()
-            
-            # Generate platform-specific content
-            if platforms is None:
-                platforms = ["devto"]  # Only Dev.to for now
-            
-            # Filter out platforms that are not available
-            available_platforms = self.social_media_manager.get_available_platforms()
-            platforms = [p for p in platforms if p in available_platforms]
-            
-            if not platforms:
-                return {
-                    "success": False, 
-                    "error": "No available platforms found. Please check your platform configuration.",
-                    "scheduled_posts": {},
-                    "event": {
-                        "title": "Error",
-                        "date": "",
-                        "description": ""
-                    }
-                }
-            
-            scheduled_posts = {}
-            
-            for platform in platforms:
-                # Generate content for this platform
-                content_result = self.ai_agent.generate_platform_content(platform, {
+                # Generate content for all platforms in one AI call
+                content_results = self.ai_agent.generate_multi_platform_content(platforms, {
                     "title": event_data["title"],
                     "description": event_data["description"],
                     "date": event_data["start_date"].strftime("%B %d, %Y at %I:%M %p"),
                     "registration_link": event_data.get("html_link", "")
                 })
                 
-                if not content_result["success"]:
-                    logger.error(f"Failed to generate content for {platform}: {content_result['error']}")
-                    continue
-                
-                # Save the post to the database with status 'Scheduled'
-                post_id = f"P{str(uuid.uuid4())[:8].upper()}"
-                db = SessionLocal()
+                # Save event if not exists, as one INSERT ... SELECT ... WHERE NOT EXISTS
                 try:
-                    # Save event if not exists
-                    event_db = db.query(EventDetails).filter_by(EventID=event_data["id"]).first()
-                    if not event_db:
-                        event_db = EventDetails(
-                            EventID=event_data["id"],
-                            Title=event_data["title"],
-                            Date=event_data["start_date"].date(),
-                            Time=event_data["start_date"].time(),
-                            Description=event_data["description"],
-                            RegistrationLink=event_data.get("html_link", ""),
-                            IsRecorded="No"
+                    event_exists = select(EventDetails.EventID).where(EventDetails.EventID == event_data["id"]).exists()
+                    inserted = db.execute(
+                        insert(EventDetails).from_select(
+                            ["EventID", "Title", "Date", "Time", "Description", "RegistrationLink", "IsRecorded"],
+                            select(
+                                literal(event_data["id"]),
+                                literal(event_data["title"]),
+                                literal(event_data["start_date"].date()),
+                                literal(event_data["start_date"].time()),
+                                literal(event_data["description"]),
+                                literal(event_data.get("html_link", "")),
+                                literal("No")
+                            ).where(~event_exists)
                         )
-                        db.add(event_db)
-                        db.commit()
-                    # Ensure scheduled_time_ist is timezone-aware and in IST
-                    if scheduled_time_ist.tzinfo is None or scheduled_time_ist.tzinfo.zone != IST.zone:
-                        scheduled_time_ist = IST.localize(scheduled_time_ist.replace(tzinfo=None))
-                    # Save post
+                    )
+                    if inserted.rowcount:
+                        self.invalidate_events_cache()
+                except Exception as e:
+                    logger.error(f"Database error saving event: {e}")
+                    db.rollback()
+                
+                new_posts = []
+                audit_rows = []
+                publish_jobs = []
+                for platform in platforms:
+                    content_result = content_results[platform]
+                    
+                    if not content_result["success"]:
+                        logger.error(f"Failed to generate content for {platform}: {content_result['error']}")
+                        continue
+                    
+                    # Save the post to the database with status 'Scheduled'
+                    post_id = f"P{token_hex(4).upper()}"
                     logger.info(f"Saving post with IST date: {scheduled_time_ist.date()}, time: {scheduled_time_ist.time()} (tz: {scheduled_time_ist.tzinfo})")
-                    post_db = SocialMediaPosts(
+                    new_posts.append(SocialMediaPosts(
                         PostID=post_id,
                         Platform=platform,
                         PostDate=scheduled_time_ist.date(),
@@ -237,46 +339,52 @@ class CommunicationScheduler:
                         Status="Scheduled",
                         EventID=event_data["id"],
                         PlatformPostID=None  # Not known until published
-                    )
-                    db.add(post_db)
+                    ))
                     # Log the action
-                    audit_log = AuditLog(
-                        LogID=f"LOG{str(uuid.uuid4())[:8].upper()}",
-                        Action="post_scheduled",
-                        EntityType="post",
-                        EntityID=post_id,
-                        Details=f"Scheduled {platform} post for {event_data['title']}",
-                        Status="success"
-                    )
-                    db.add(audit_log)
-                    db.commit()
+                    audit_rows.append(self._audit_row(
+                        "post_scheduled", "post", post_id,
+                        f"Scheduled {platform} post for {event_data['title']}"
+                    ))
                     scheduled_posts[platform] = {
                         "post_id": post_id,
                         "content": content_result["content"],
-                        "scheduled_time": scheduled_time_ist.strftime("%Y-%m-%d %H:%M:%S %Z%z")
+                        "scheduled_time": scheduled_time_str
                     }
-                    # Schedule the actual posting job
-                    job_id = f"publish_{post_id}_{platform}"
-                    from app.scheduler import publish_scheduled_post
+                    publish_jobs.append((post_id, platform))
+                
+                # Save all posts in a single commit; their audit logs are written behind
+                try:
+                    db.bulk_save_objects(new_posts)
+                    db.commit()
+                    self._queue_audit_logs(audit_rows)
+                except Exception as e:
+                    import traceback
+                    logger.error(f"Database error saving post: {e}\n{traceback.format_exc()}")
+                    db.rollback()
+                    scheduled_posts = {}
+                    publish_jobs = []
+            
+            # Schedule the actual posting jobs once the posts are committed
+            from app.scheduler import publish_scheduled_post
+            for post_id, platform in publish_jobs:
+                job_id = f"publish_{post_id}_{platform}"
+                try:
                     self.scheduler.add_job(
                         func=publish_scheduled_post,
                         trigger=DateTrigger(run_date=scheduled_time_ist),
                         args=[post_id, platform],
                         id=job_id,
+                        executor='publish',
                         replace_existing=True
                     )
                 except Exception as e:
-                    import traceback
-                    logger.error(f"Database error saving post: {e}\n{traceback.format_exc()}")
-                    db.rollback()
-                finally:
-                    db.close()
+                    logger.error(f"Error scheduling publish job {job_id}: {e}")
             return {
                 "success": True,
                 "scheduled_posts": scheduled_posts,
                 "event": {
                     "title": event_data["title"],
-                    "date": event_data["start_date"].astimezone(IST).strftime("%Y-%m-%d %H:%M:%S %Z%z"),
+                    "date": event_data["start_date"].strftime("%Y-%m-%d %H:%M:%S %Z%z"),
                     "description": event_data["description"]
                 },
                 "immediate": is_immediate,
@@ -300,43 +408,87 @@ class CommunicationScheduler:
                 }
             }
 
+    def reload_platforms(self):
+        """Reset the cached platform lookups from the social media manager"""
+        self._available_platforms = frozenset(self.social_media_manager.get_available_platforms())
+        self._platform_cache = {}
+    
+    def _get_platform(self, platform: str):
+        """Return the platform client, resolving it from the manager on first use"""
+        key = platform.lower()
+        platform_instance = self._platform_cache.get(key)
+        if platform_instance is None:
+            platform_instance = self.social_media_manager.get_platform(key)
+            if platform_instance is not None:
+                self._platform_cache[key] = platform_instance
+        return platform_instance
+    
+    def _get_available_events(self, db) -> List[Dict[str, Any]]:
+        """Return the event catalog for AI matching, cached for a short TTL"""
+        if self._events_cache is not None and monotonic() - self._events_cache_ts < self._events_cache_ttl:
+            return self._events_cache
+        
+        # Read only the matching columns as plain rows, skipping ORM object construction
+        rows = db.execute(
+            select(
+                EventDetails.EventID,
+                EventDetails.Title,
+                func.coalesce(EventDetails.Description, "").label("Description"),
+                EventDetails.Date,
+                EventDetails.Time,
+                func.coalesce(EventDetails.RegistrationLink, "").label("RegistrationLink")
+            ).order_by(EventDetails.Date.desc())
+        ).mappings()
+        # Convert events to dictionary format for AI processing
+        available_events = [dict(row) for row in rows]
+        self._events_cache = available_events
+        self._events_cache_ts = monotonic()
+        return available_events
+    
+    def invalidate_events_cache(self):
+        """Drop the cached event catalog so the next schedule_post re-reads it"""
+        self._events_cache = None
+        self._events_cache_ts = 0.0
+
     def edit_scheduled_post(self, post_id: str, new_content: Optional[str] = None, new_time: Optional[datetime] = None) -> Dict[str, Any]:
         """Edit the content and/or scheduled time of a scheduled post"""
-        db = SessionLocal()
         try:
-            post = db.query(SocialMediaPosts).filter_by(PostID=post_id, Status="Scheduled").first()
-            if not post:
-                return {"success": False, "error": "Scheduled post not found or already published."}
-            if new_content:
-                post.ContentPreview = new_content
-            if new_time:
-                # Convert new_time to IST
-                if new_time.tzinfo is None:
-                    new_time = pytz.utc.localize(new_time)
-                new_time_ist = new_time.astimezone(IST)
-                post.PostDate = new_time_ist.date()
-                post.PostTime = new_time_ist.time()
-                # Reschedule the APScheduler job
-                job_id = f"publish_{post_id}_{post.Platform}"
-                self.scheduler.reschedule_job(job_id, trigger=DateTrigger(run_date=new_time_ist))
-            db.commit()
+            with session_scope() as db:
+                post = db.query(SocialMediaPosts).filter_by(PostID=post_id, Status="Scheduled").first()
+                if not post:
+                    return {"success": False, "error": "Scheduled post not found or already published."}
+                if new_content:
+                    post.ContentPreview = new_content
+                if new_time:
+                    # Convert new_time to IST
+                    if new_time.tzinfo is None:
+                        new_time = new_time.replace(tzinfo=timezone.utc)
+                    new_time_ist = new_time.astimezone(IST)
+                    post.PostDate = new_time_ist.date()
+                    post.PostTime = new_time_ist.time()
+                    # Reschedule the APScheduler job
+                    job_id = f"publish_{post_id}_{post.Platform}"
+                    self.scheduler.reschedule_job(job_id, trigger=DateTrigger(run_date=new_time_ist))
             return {"success": True, "message": "Scheduled post updated."}
         except Exception as e:
-            db.rollback()
             logger.error(f"Error editing scheduled post: {e}")
             return {"success": False, "error": str(e)}
-        finally:
-            db.close()
 
     def cancel_scheduled_post(self, post_id: str, platform: str) -> Dict[str, Any]:
         """Cancel a scheduled post and remove its job"""
-        db = SessionLocal()
         try:
-            post = db.query(SocialMediaPosts).filter_by(PostID=post_id, Platform=platform, Status="Scheduled").first()
-            if not post:
-                return {"success": False, "error": "Scheduled post not found or already published."}
-            post.Status = "Cancelled"
-            db.commit()
+            with session_scope() as db:
+                cancelled = db.execute(
+                    update(SocialMediaPosts)
+                    .where(
+                        SocialMediaPosts.PostID == post_id,
+                        SocialMediaPosts.Platform == platform,
+                        SocialMediaPosts.Status == "Scheduled"
+                    )
+                    .values(Status="Cancelled")
+                )
+                if not cancelled.rowcount:
+                    return {"success": False, "error": "Scheduled post not found or already published."}
             # Remove the scheduled job
             job_id = f"publish_{post_id}_{platform}"
             try:
@@ -345,61 +497,143 @@ class CommunicationScheduler:
                 logger.warning(f"Job removal warning: {e}")
             return {"success": True, "message": "Scheduled post cancelled."}
         except Exception as e:
-            db.rollback()
             logger.error(f"Error cancelling scheduled post: {e}")
             return {"success": False, "error": str(e)}
-        finally:
-            db.close()
 
     def _publish_scheduled_post(self, post_id: str, platform: str):
         """Publish the scheduled post to the real platform and update status, with notification"""
-        db = None
         try:
-            db = SessionLocal()
-            post = db.query(SocialMediaPosts).filter_by(PostID=post_id, Platform=platform).first()
-            if not post:
-                logger.error(f"Scheduled post {post_id} for {platform} not found in DB.")
-                return
-            if post.Status == "Published":
-                logger.info(f"Post {post_id} for {platform} already published.")
-                return
-            if post.Status == "Cancelled":
-                logger.info(f"Post {post_id} for {platform} was cancelled.")
-                return
-            # Get the content
-            content = post.ContentPreview
-            # Get the platform instance
-            platform_instance = self.social_media_manager.get_platform(platform)
-            if not platform_instance:
-                logger.error(f"Platform {platform} not found for publishing post {post_id}.")
-                self._send_notification(f"Failed to publish post {post_id} to {platform}: platform not found.")
-                return
-            # Actually post to the platform
-            now_ist = datetime.now(IST)
-            result = platform_instance.schedule_post(content, now_ist)
-            if result.get("success"):
-                post.Status = "Published"
-                # Save the real platform post ID
-                post.PlatformPostID = result.get("post_id", None)
+            with session_scope() as db:
+                post = db.execute(
+                    select(SocialMediaPosts.Status, SocialMediaPosts.ContentPreview)
+                    .where(SocialMediaPosts.PostID == post_id, SocialMediaPosts.Platform == platform)
+                ).first()
+                if not post:
+                    logger.error(f"Scheduled post {post_id} for {platform} not found in DB.")
+                    return
+                if post.Status == "Published":
+                    logger.info(f"Post {post_id} for {platform} already published.")
+                    return
+                if post.Status == "Cancelled":
+                    logger.info(f"Post {post_id} for {platform} was cancelled.")
+                    return
+                # Get the content
+                content = post.ContentPreview
+                # Release the connection while the platform call is in flight
                 db.commit()
-                logger.info(f"Published post {post_id} to {platform} at scheduled time.")
-                self._send_notification(f"✅ Published post {post_id} to {platform} at scheduled time.")
-                # Schedule comment monitoring after publishing
-                self._schedule_comment_monitoring(post_id, platform, result.get("post_id", ""))
-            else:
-                post.Status = "Failed"
-                db.commit()
-                logger.error(f"Failed to publish post {post_id} to {platform}: {result.get('error')}")
-                self._send_notification(f"❌ Failed to publish post {post_id} to {platform}: {result.get('error')}")
+                # Get the platform instance
+                platform_instance = self._get_platform(platform)
+                if not platform_instance:
+                    logger.error(f"Platform {platform} not found for publishing post {post_id}.")
+                    self._send_notification(f"Failed to publish post {post_id} to {platform}: platform not found.")
+                    return
+                # Actually post to the platform
+                now_ist = datetime.now(IST)
+                result = platform_instance.schedule_post(content, now_ist)
+                post_filter = (SocialMediaPosts.PostID == post_id, SocialMediaPosts.Platform == platform)
+                if result.get("success"):
+                    # Save the real platform post ID
+                    db.execute(
+                        update(SocialMediaPosts)
+                        .where(*post_filter)
+                        .values(Status="Published", PlatformPostID=result.get("post_id", None))
+                    )
+                    db.commit()
+                    if result.get("post_id"):
+                        self._remember_platform_post_id(post_id, platform, result["post_id"])
+                    logger.info(f"Published post {post_id} to {platform} at scheduled time.")
+                    self._send_notification(f"✅ Published post {post_id} to {platform} at scheduled time.")
+                    # Schedule comment monitoring after publishing
+                    self._schedule_comment_monitoring(post_id, platform, result.get("post_id", ""))
+                else:
+                    db.execute(update(SocialMediaPosts).where(*post_filter).values(Status="Failed"))
+                    db.commit()
+                    logger.error(f"Failed to publish post {post_id} to {platform}: {result.get('error')}")
+                    self._send_notification(f"❌ Failed to publish post {post_id} to {platform}: {result.get('error')}")
         except Exception as e:
             logger.error(f"Error in _publish_scheduled_post: {e}")
-            if db:
-                db.rollback()
             self._send_notification(f"❌ Error in publishing post {post_id} to {platform}: {e}")
-        finally:
-            if db:
-                db.close()
 
+    @staticmethod
+    def _audit_row(action: str, entity_type: str, entity_id: str, details: str, status: str = "success") -> Dict[str, Any]:
+        """Build an AuditLog row for the write-behind queue"""
+        return {
+            "LogID": f"LOG{token_hex(4).upper()}",
+            "Action": action,
+            "EntityType": entity_type,
+            "EntityID": entity_id,
+            "Details": details,
+            "Timestamp": datetime.utcnow(),
+            "Status": status
+        }
+    
+    def _queue_audit_logs(self, rows: List[Dict[str, Any]]):
+        """Hand audit log rows to the background writer"""
+        for row in rows:
+            self._audit_queue.put(row)
+        if self._audit_queue.qsize() >= AUDIT_FLUSH_BATCH_SIZE:
+            self._audit_wakeup.set()
+    
+    def flush_audit_logs(self):
+        """Write every queued audit log now, in batches"""
+        with self._audit_flush_lock:
+            while True:
+                rows = []
+                try:
+                    while len(rows) < AUDIT_FLUSH_BATCH_SIZE:
+                        rows.append(self._audit_queue.get_nowait())
+                except queue.Empty:
+                    pass
+                if not rows:
+                    return
+                try:
+                    with session_scope() as db:
+                        db.execute(AuditLog.__table__.insert(), rows)
+                except Exception as e:
+                    logger.error(f"Error writing {len(rows)} audit logs: {e}")
+    
+    def _audit_writer(self):
+        """Flush queued audit logs every interval, or sooner once a full batch is waiting"""
+        while not self._audit_stop.is_set():
+            self._audit_wakeup.wait(AUDIT_FLUSH_INTERVAL_SECONDS)
+            self._audit_wakeup.clear()
+            self.flush_audit_logs()
+    
+    def _remember_platform_post_id(self, post_id: str, platform: str, platform_post_id: str):
+        """Cache the platform's ID for a published post"""
+        with self._platform_post_ids_lock:
+            self._platform_post_ids[(post_id, platform)] = platform_post_id
+            self._platform_post_ids.move_to_end((post_id, platform))
+            while len(self._platform_post_ids) > PLATFORM_POST_ID_CACHE_MAX_ENTRIES:
+                self._platform_post_ids.popitem(last=False)
+    
+    def _advance_monitor_cursor(self, cursor_key: tuple, seen_ids: frozenset):
+        """Record the comment IDs handled on this tick, evicting the least recently used posts"""
+        with self._monitor_cursors_lock:
+            self._monitor_cursors[cursor_key] = seen_ids
+            self._monitor_cursors.move_to_end(cursor_key)
+            while len(self._monitor_cursors) > MONITOR_CURSOR_MAX_ENTRIES:
+                self._monitor_cursors.popitem(last=False)
+    
+    def _forget_monitor_cursor(self, post_id: str, platform: str):
+        with self._monitor_cursors_lock:
+            self._monitor_cursors.pop((post_id, platform), None)
+    
+    def _get_platform_post_id(self, post_id: str, platform: str) -> Optional[str]:
+        """Return the platform's ID for a post: None if the post doesn't exist, "" if it isn't published yet"""
+        with self._platform_post_ids_lock:
+            cached = self._platform_post_ids.get((post_id, platform))
+            if cached:
+                self._platform_post_ids.move_to_end((post_id, platform))
+                return cached
+        with session_scope() as db:
+            post = db.execute(_PLATFORM_POST_ID_STMT, {"post_id": post_id, "platform": platform}).first()
+        if not post:
+            return None
+        if post.PlatformPostID:
+            self._remember_platform_post_id(post_id, platform, post.PlatformPostID)
+        return post.PlatformPostID or ""
+    
     def _send_notification(self, message: str):
         """Send a notification (currently logs, can be extended to email, Slack, etc.)"""
         logger.info(f"NOTIFICATION: {message}")
@@ -407,14 +641,9 @@ class CommunicationScheduler:
     def _schedule_comment_monitoring(self, post_id: str, platform: str, platform_post_id: str):
         """Schedule comment monitoring for a specific post"""
         try:
-            db = None
             # Always fetch the latest platform_post_id from the DB if not provided
             if not platform_post_id:
-                db = SessionLocal()
-                post = db.query(SocialMediaPosts).filter_by(PostID=post_id, Platform=platform).first()
-                platform_post_id = post.PlatformPostID if post else None
-                if db:
-                    db.close()
+                platform_post_id = self._get_platform_post_id(post_id, platform) or None
             logger.info(f"[DEBUG] Running _monitor_comments for post_id={post_id}, platform={platform}, platform_post_id={platform_post_id}")
             # Schedule monitoring to start 15 minutes after post time
             # and run every 15 minutes for 24 hours
@@ -424,13 +653,17 @@ class CommunicationScheduler:
                 self.scheduler.remove_job(job_id)
             except Exception as e:
                 logger.info(f"[DEBUG] No existing job to remove for {job_id}: {e}")
-            # Schedule the monitoring job as a top-level function
+            # Schedule the monitoring job as a top-level function; APScheduler drops it after end_date
+            now_ist = datetime.now(IST)
+            start = now_ist + timedelta(minutes=15)
+            end = now_ist + timedelta(hours=24)
             from app.scheduler import monitor_comments_job
             self.scheduler.add_job(
                 func=monitor_comments_job,
-                trigger=CronTrigger(minute="*/15"),  # Every 15 minutes
+                trigger=IntervalTrigger(minutes=15, start_date=start, end_date=end, timezone=IST),
                 args=[post_id, platform, platform_post_id],
                 id=job_id,
+                executor='monitor',
                 max_instances=1,
                 replace_existing=True
             )
@@ -440,23 +673,71 @@ class CommunicationScheduler:
     
     @staticmethod
     def html_to_text(html: str) -> str:
-        soup = BeautifulSoup(html, "html.parser")
-        return soup.get_text(separator=" ", strip=True)
+        return _WS_RE.sub(" ", unescape(_TAG_RE.sub(" ", html or ""))).strip()
+
+    async def _process_comment(self, comment_id: str, cleaned_text: str, event_data: Dict[str, Any],
+                               platform_instance, platform_post_id: str) -> Dict[str, Any]:
+        """Classify, draft and send the reply for one comment (no database access)"""
+        # Classify the comment
+        try:
+            classification_result = await self.ai_agent.aclassify_comment(cleaned_text)
+            classification = classification_result.get("classification", "event-related")
+        except Exception as e:
+            classification = "event-related"  # Default fallback
+        
+        # Generate AI response
+        try:
+            response_result = await self.ai_agent.agenerate_comment_response(cleaned_text, classification, event_data)
+            if not response_result.get("success"):
+                logger.error(f"❌ Failed to generate response for comment {comment_id}: {response_result.get('error')}")
+                response_status = "Failed"
+                send_result = {"success": False, "error": response_result.get("error")}
+            else:
+                response_text = response_result.get("response", "")
+                # Send the response without blocking the loop
+                send_result = await platform_instance.arespond_to_comment(
+                    comment_id,
+                    response_text,
+                    parent_type="article",
+                    parent_id=platform_post_id,
+                    executor=_comment_reply_executor
+                )
+                response_status = "Responded" if send_result.get("success") else "Failed"
+        except Exception as e:
+            logger.error(f"❌ Exception while sending response to comment {comment_id}: {e}")
+            response_status = "Failed"
+            send_result = {"success": False, "error": str(e)}
+        
+        return {"classification": classification, "response_status": response_status, "send_result": send_result}
+    
+    async def _process_comments_async(self, pending: List[Dict[str, Any]], event_data: Dict[str, Any],
+                                      platform_instance, platform_post_id: str) -> List[Dict[str, Any]]:
+        """Process comments concurrently, preserving input order"""
+        semaphore = asyncio.Semaphore(AI_MAX_CONCURRENT_REQUESTS)
+        
+        async def process(item: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._process_comment(
+                    item["comment_id"], item["cleaned_text"], event_data, platform_instance, platform_post_id
+                )
+        
+        return await asyncio.gather(*(process(item) for item in pending))
 
     def _monitor_comments(self, post_id: str, platform: str, platform_post_id: str):
         """Monitor comments for a specific post"""
         try:
-            db = None
-            # Always fetch the latest platform_post_id from the DB if not provided
+            # Always fetch the latest platform_post_id from the DB if not provided;
+            # the same row is reused for the event data below
+            post_with_event = None
             if not platform_post_id:
-                db = SessionLocal()
-                post = db.query(SocialMediaPosts).filter_by(PostID=post_id, Platform=platform).first()
-                platform_post_id = post.PlatformPostID if post else None
-                if db:
-                    db.close()
+                with session_scope() as db:
+                    post_with_event = db.query(SocialMediaPosts).options(
+                        joinedload(SocialMediaPosts.event)
+                    ).filter_by(PostID=post_id, Platform=platform).first()
+                    platform_post_id = post_with_event.PlatformPostID if post_with_event else None
             
             # Get platform instance
-            platform_instance = self.social_media_manager.get_platform(platform)
+            platform_instance = self._get_platform(platform)
             if not platform_instance:
                 logger.error(f"❌ Platform {platform} not found for comment monitoring")
                 return
@@ -471,181 +752,221 @@ class CommunicationScheduler:
             if len(comments) == 0:
                 return  # No comments to process
             
+            # Nothing new since the last fully handled tick: skip the database entirely
+            cursor_key = (post_id, platform)
+            seen_ids = frozenset(str(c.get("comment_id", "")).strip() for c in comments)
+            with self._monitor_cursors_lock:
+                unchanged = self._monitor_cursors.get(cursor_key) == seen_ids
+            if unchanged:
+                logger.debug(f"No new comments for {platform} post {post_id}")
+                return
+            
             logger.info(f"📝 Processing {len(comments)} comments for {platform} post {post_id}")
             
-            # Process each comment
-            db = None
-            try:
-                db = SessionLocal()
-                for comment in comments:
-                    # Strict validation for comment_id
-                    if not comment.get("comment_id") or not str(comment["comment_id"]).strip():
-                        continue
-                    
-                    comment_id = str(comment["comment_id"]).strip()
-                    
-                    # Clean up comment text
-                    cleaned_text = self.html_to_text(comment.get("text", ""))
-                    if not cleaned_text.strip():
-                        continue
-                    
-                    # Check if comment already exists
-                    existing_comment = db.query(SocialMediaComments).filter_by(
-                        CommentID=comment_id
-                    ).first()
+            with session_scope() as db:
+                # Process each comment
+                try:
+                    # Load every already-stored comment for this batch in one query
+                    comment_ids = [str(c["comment_id"]).strip() for c in comments if c.get("comment_id")]
+                    existing_comments = {
+                        c.CommentID: c
+                        for c in db.query(SocialMediaComments).filter(SocialMediaComments.CommentID.in_(comment_ids)).all()
+                    } if comment_ids else {}
                     
-                    retry_count = 0
-                    if existing_comment:
-                        if existing_comment.ResponseStatus == "Responded":
-                            continue  # Already responded
-                        retry_count = getattr(existing_comment, 'RetryCount', 0)
-                        if retry_count >= 3:
-                            existing_comment.ResponseStatus = "Escalated"
-                            db.commit()
-                            logger.warning(f"⚠️ Comment {comment_id} escalated after 3 retries")
+                    pending = []
+                    changes = []
+                    for comment in comments:
+                        # Strict validation for comment_id
+                        if not comment.get("comment_id") or not str(comment["comment_id"]).strip():
                             continue
-                        existing_comment.ResponseStatus = "Pending"
-                        existing_comment.RetryCount = retry_count + 1
-                        db.commit()
-                    
-                    # Classify the comment
-                    try:
-                        classification_result = self.ai_agent.classify_comment(cleaned_text)
-                        classification = classification_result.get("classification", "event-related")
-                    except Exception as e:
-                        classification = "event-related"  # Default fallback
-                    
-                    # Generate AI response
-                    try:
-                        # Get event data for the post
-                        post_with_event = db.query(SocialMediaPosts).filter_by(PostID=post_id).first()
-                        event_data = {}
-                        if post_with_event and post_with_event.event:
-                            event_data = {
-                                "title": post_with_event.event.Title or "",
-                                "registration_link": post_with_event.event.RegistrationLink or "",
-                                "is_recorded": post_with_event.event.IsRecorded or False
-                            }
                         
-                        response_result = self.ai_agent.generate_comment_response(cleaned_text, classification, event_data)
-                        if not response_result.get("success"):
-                            logger.error(f"❌ Failed to generate response for comment {comment_id}: {response_result.get('error')}")
-                            response_status = "Failed"
-                            send_result = {"success": False, "error": response_result.get("error")}
-                        else:
-                            response_text = response_result.get("response", "")
-                            # Send the response
-                            send_result = platform_instance.respond_to_comment(
-                                comment_id, 
-                                response_text,
-                                parent_type="article",
-                                parent_id=platform_post_id
-                            )
-                            response_status = "Responded" if send_result.get("success") else "Failed"
-                    except Exception as e:
-                        logger.error(f"❌ Exception while sending response to comment {comment_id}: {e}")
-                        response_status = "Failed"
-                        send_result = {"success": False, "error": str(e)}
-                    
-                    # Save or update comment in database
-                    try:
+                        comment_id = str(comment["comment_id"]).strip()
+                        
+                        # Check if comment already exists
+                        existing_comment = existing_comments.get(comment_id)
+                        if existing_comment and existing_comment.ResponseStatus == "Responded":
+                            continue  # Already responded; no need to strip its HTML
+                        
+                        # Clean up comment text
+                        cleaned_text = self.html_to_text(comment.get("text", ""))
+                        if not cleaned_text.strip():
+                            continue
+                        
+                        retry_count = 0
                         if existing_comment:
-                            existing_comment.ResponseStatus = response_status
-                            existing_comment.CommentText = cleaned_text
-                            existing_comment.Timestamp = comment.get("timestamp", datetime.now())
-                            existing_comment.Classification = classification
-                            existing_comment.RetryCount = retry_count + 1
-                            db.commit()
+                            retry_count = getattr(existing_comment, 'RetryCount', 0)
+                            if retry_count >= 3:
+                                changes.append((existing_comment, {"ResponseStatus": "Escalated"}))
+                                logger.warning(f"⚠️ Comment {comment_id} escalated after 3 retries")
+                                continue
+                            row = existing_comment
+                            changes.append((row, {"ResponseStatus": "Pending", "RetryCount": retry_count + 1}))
                         else:
-                            new_comment = SocialMediaComments(
+                            # New comments are stored as Pending before any reply goes out
+                            row = SocialMediaComments(
                                 CommentID=comment_id,
                                 PostID=post_id,
                                 UserName=comment.get("user_name", "Unknown"),
                                 CommentText=cleaned_text,
                                 Timestamp=comment.get("timestamp", datetime.now()),
-                                ResponseStatus=response_status,
-                                Classification=classification,
+                                ResponseStatus="Pending",
                                 RetryCount=1
                             )
-                            db.add(new_comment)
-                            db.commit()
+                            changes.append((row, {}))
+                        
+                        pending.append({
+                            "comment": comment,
+                            "comment_id": comment_id,
+                            "cleaned_text": cleaned_text,
+                            "row": row,
+                            "retry_count": retry_count
+                        })
+                    
+                    # Persist escalations, retry markers and new Pending rows before replying;
+                    # a comment whose row could not be saved is not replied to
+                    saved = {id(row) for row in self._save_comment_rows(db, changes)}
+                    pending = [item for item in pending if id(item["row"]) in saved]
+                    
+                    if not pending:
+                        if len(saved) == len(changes):
+                            self._advance_monitor_cursor(cursor_key, seen_ids)
+                        return
+                    
+                    # Get event data for the post, once for the whole batch
+                    if post_with_event is None:
+                        post_with_event = db.query(SocialMediaPosts).options(
+                            joinedload(SocialMediaPosts.event)
+                        ).filter_by(PostID=post_id).first()
+                    event_data = {}
+                    if post_with_event and post_with_event.event:
+                        event_data = {
+                            "title": post_with_event.event.Title or "",
+                            "registration_link": post_with_event.event.RegistrationLink or "",
+                            "is_recorded": post_with_event.event.IsRecorded or False
+                        }
+                    
+                    # Classify, generate and send replies for all comments concurrently
+                    results = run_async(self._process_comments_async(pending, event_data, platform_instance, platform_post_id))
+                    
+                    changes = []
+                    audit_logs = []
+                    for item, result in zip(pending, results):
+                        comment_id = item["comment_id"]
+                        classification = result["classification"]
+                        send_result = result["send_result"]
+                        
+                        changes.append((item["row"], {
+                            "ResponseStatus": result["response_status"],
+                            "CommentText": item["cleaned_text"],
+                            "Timestamp": item["comment"].get("timestamp", datetime.now()),
+                            "Classification": classification,
+                            "RetryCount": item["retry_count"] + 1
+                        }))
                         
                         # Log the response
-                        audit_log = AuditLog(
-                            LogID=f"LOG{str(uuid.uuid4())[:8].upper()}",
-                            Action="comment_responded",
-                            EntityType="comment",
-                            EntityID=comment_id,
-                            Details=f"Responded to comment on post {post_id} with classification {classification}",
-                            Status="success" if send_result.get("success") else "failed"
-                        )
-                        db.add(audit_log)
-                        db.commit()
+                        audit_logs.append(self._audit_row(
+                            "comment_responded", "comment", comment_id,
+                            f"Responded to comment on post {post_id} with classification {classification}",
+                            "success" if send_result.get("success") else "failed"
+                        ))
                         
                         # Show result
                         if send_result.get("success"):
                             logger.info(f"✅ Successfully replied to comment {comment_id}")
                         else:
                             logger.error(f"❌ Failed to reply to comment {comment_id}: {send_result.get('error', 'Unknown error')}")
-                        
-                    except Exception as e:
-                        logger.error(f"❌ Failed to save comment {comment_id} to database: {e}")
-                        db.rollback()
-            except Exception as e:
-                logger.error(f"❌ Error monitoring comments: {e}")
-                if db:
+                    
+                    # Save the outcomes (one commit, or per row if that fails); audit logs are written behind
+                    saved_count = len(self._save_comment_rows(db, changes))
+                    self._queue_audit_logs(audit_logs)
+                    
+                    # Failed replies are retried on the next tick, so only then is the cursor kept back
+                    if saved_count == len(changes) and all(result["response_status"] == "Responded" for result in results):
+                        self._advance_monitor_cursor(cursor_key, seen_ids)
+                except Exception as e:
+                    logger.error(f"❌ Error monitoring comments: {e}")
                     db.rollback()
-            finally:
-                if db:
-                    db.close()
         except Exception as e:
             logger.error(f"❌ Error in comment monitoring: {e}")
     
+    @staticmethod
+    def _save_comment_rows(db: Session, changes: List[tuple]) -> List[SocialMediaComments]:
+        """Apply (row, values) changes in one commit, falling back to a commit per row so one bad row cannot discard the rest"""
+        def apply(row, values):
+            for column, value in values.items():
+                setattr(row, column, value)
+            db.add(row)
+        
+        if not changes:
+            return []
+        try:
+            for row, values in changes:
+                apply(row, values)
+            db.commit()
+            return [row for row, _ in changes]
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"⚠️ Batched comment save failed, saving comments one by one: {e}")
+        
+        saved = []
+        for row, values in changes:
+            try:
+                apply(row, values)
+                db.commit()
+                saved.append(row)
+            except Exception as e:
+                db.rollback()
+                logger.error(f"❌ Failed to save comment {row.CommentID}: {e}")
+        return saved
+    
     def get_scheduled_posts(self) -> List[Dict[str, Any]]:
         """Get all scheduled posts"""
         try:
-            db = SessionLocal()
-            posts = db.query(SocialMediaPosts).filter_by(Status="Scheduled").all()
-            
-            result = []
-            for post in posts:
-                result.append({
-                    "post_id": post.PostID,
-                    "platform": post.Platform,
-                    "scheduled_time": f"{post.PostDate} {post.PostTime}",
-                    "content_preview": post.ContentPreview,
-                    "campaign_tag": post.CampaignTag,
-                    "event_title": post.event.Title if post.event else None,
-                    "platform_post_id": post.PlatformPostID
-                })
+            with session_scope() as db:
+                posts = db.query(SocialMediaPosts).options(
+                    selectinload(SocialMediaPosts.event)
+                ).filter_by(Status="Scheduled").all()
+                
+                result = []
+                for post in posts:
+                    result.append({
+                        "post_id": post.PostID,
+                        "platform": post.Platform,
+                        "scheduled_time": f"{post.PostDate} {post.PostTime}",
+                        "scheduled_dt": datetime.combine(post.PostDate, post.PostTime),
+                        "content_preview": post.ContentPreview,
+                        "campaign_tag": post.CampaignTag,
+                        "event_title": post.event.Title if post.event else None,
+                        "platform_post_id": post.PlatformPostID
+                    })
             
-            db.close()
             return result
             
         except Exception as e:
             logger.error(f"Error getting scheduled posts: {e}")
             return []
     
-    def get_pending_comments(self) -> List[Dict[str, Any]]:
-        """Get all pending comments that need human review"""
-        try:
-            db = SessionLocal()
-            comments = db.query(SocialMediaComments).filter_by(ResponseStatus="Pending").all()
+    def iter_pending_comments(self, batch_size: int = 500) -> Iterator[Dict[str, Any]]:
+        """Yield pending comments, fetching them from the database in batches"""
+        with session_scope() as db:
+            # Plain column rows with the platform joined in; no ORM objects are built
+            comments = db.execute(_PENDING_COMMENTS_STMT, execution_options={"yield_per": batch_size})
             
-            result = []
             for comment in comments:
-                result.append({
+                yield {
                     "comment_id": comment.CommentID,
                     "post_id": comment.PostID,
-                    "platform": comment.post.Platform if comment.post else "Unknown",
+                    "platform": comment.Platform or "Unknown",
                     "user_name": comment.UserName,
                     "comment_text": comment.CommentText,
                     "classification": comment.Classification,
                     "timestamp": comment.Timestamp.isoformat()
-                })
-            
-            db.close()
-            return result
+                }
+    
+    def get_pending_comments(self) -> List[Dict[str, Any]]:
+        """Get all pending comments that need human review"""
+        try:
+            return list(self.iter_pending_comments())
             
         except Exception as e:
             logger.error(f"Error getting pending comments: {e}")
@@ -655,27 +976,38 @@ class CommunicationScheduler:
         """Shutdown the scheduler"""
         try:
             self.scheduler.shutdown()
+            # Stop the audit writer and write whatever is still queued
+            self._audit_stop.set()
+            self._audit_wakeup.set()
+            self._audit_thread.join(timeout=5)
+            self.flush_audit_logs()
             logger.info("Communication scheduler shutdown")
+            # Let the next instance() call build a fresh scheduler
+            with CommunicationScheduler._instance_lock:
+                if CommunicationScheduler._instance is self:
+                    CommunicationScheduler._instance = None
         except Exception as e:
             logger.error(f"Error shutting down scheduler: {e}")
 
     def cleanup_disabled_platform_jobs(self):
         """Clean up scheduled jobs for disabled platforms"""
         try:
-            disabled_platforms = ["linkedin"]
-            removed_jobs = 0
+            if not DISABLED_PLATFORMS:
+                return 0
             
-            for platform in disabled_platforms:
-                # Get all jobs for this platform
-                jobs = self.scheduler.get_jobs()
-                for job in jobs:
-                    if job.args and len(job.args) >= 2 and job.args[1] == platform:
-                        try:
-                            self.scheduler.remove_job(job.id)
-                            removed_jobs += 1
-                            logger.info(f"Removed scheduled job {job.id} for {platform}")
-                        except Exception as e:
-                            logger.warning(f"Could not remove job {job.id}: {e}")
+            # Scan the job store once and match each job against every disabled platform
+            job_ids = [
+                job.id for job in self.scheduler.get_jobs()
+                if job.args and len(job.args) >= 2 and job.args[1] in DISABLED_PLATFORMS
+            ]
+            removed_jobs = 0
+            for job_id in job_ids:
+                try:
+                    self.scheduler.remove_job(job_id)
+                    removed_jobs += 1
+                    logger.info(f"Removed scheduled job {job_id}")
+                except Exception as e:
+                    logger.warning(f"Could not remove job {job_id}: {e}")
             
             logger.info(f"Cleaned up {removed_jobs} jobs for disabled platforms")
             return removed_jobs
@@ -689,16 +1021,11 @@ class CommunicationScheduler:
         try:
             logger.info(f"Manually triggering comment monitoring for post {post_id} on {platform}")
             
-            # Get the platform post ID from database
-            db = SessionLocal()
-            post = db.query(SocialMediaPosts).filter_by(PostID=post_id, Platform=platform).first()
-            if not post:
-                db.close()
+            # Get the platform post ID, from the database on first use
+            platform_post_id = self._get_platform_post_id(post_id, platform)
+            if platform_post_id is None:
                 return {"success": False, "error": "Post not found"}
             
-            platform_post_id = post.PlatformPostID
-            db.close()
-            
             if not platform_post_id:
                 return {"success": False, "error": "Platform post ID not found"}
             
@@ -718,28 +1045,25 @@ class CommunicationScheduler:
     def get_comment_stats(self) -> Dict[str, Any]:
         """Get statistics about comments and responses"""
         try:
-            db = SessionLocal()
-            
-            total_comments = db.query(SocialMediaComments).count()
-            pending_comments = db.query(SocialMediaComments).filter_by(ResponseStatus="Pending").count()
-            responded_comments = db.query(SocialMediaComments).filter_by(ResponseStatus="Responded").count()
-            failed_comments = db.query(SocialMediaComments).filter_by(ResponseStatus="Failed").count()
-            escalated_comments = db.query(SocialMediaComments).filter_by(ResponseStatus="Escalated").count()
-            
-            # Get classification breakdown
-            classifications = db.query(SocialMediaComments.Classification, db.func.count(SocialMediaComments.CommentID)).group_by(SocialMediaComments.Classification).all()
-            
-            db.close()
+            with session_scope() as db:
+                # One grouped scan per breakdown; totals are derived in Python
+                by_status = dict(db.execute(_COMMENT_STATUS_COUNTS_STMT).all())
+                
+                # Get classification breakdown
+                classifications = {
+                    (classification.value if classification else "unclassified"): count
+                    for classification, count in db.execute(_COMMENT_CLASSIFICATION_COUNTS_STMT).all()
+                }
             
             return {
                 "success": True,
                 "stats": {
-                    "total_comments": total_comments,
-                    "pending_comments": pending_comments,
-                    "responded_comments": responded_comments,
-                    "failed_comments": failed_comments,
-                    "escalated_comments": escalated_comments,
-                    "classifications": dict(classifications)
+                    "total_comments": sum(by_status.values()),
+                    "pending_comments": by_status.get(ResponseStatus.PENDING, 0),
+                    "responded_comments": by_status.get(ResponseStatus.RESPONDED, 0),
+                    "failed_comments": by_status.get(ResponseStatus.FAILED, 0),
+                    "escalated_comments": by_status.get(ResponseStatus.ESCALATED, 0),
+                    "classifications": classifications
                 }
             }
             
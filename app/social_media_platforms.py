@@ -1,18 +1,100 @@
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Any
+from collections import OrderedDict
 from datetime import datetime
+import asyncio
+import copy
+import functools
+import hashlib
 import logging
+import os
+import re
+import threading
+from time import monotonic
 from app.config import settings
 import tweepy  # Commented out since Twitter platform is disabled
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+_HASHTAG_RE = re.compile(r'#(\w+)')
+# Dev.to comment IDs are numeric ids or id_code slugs, which may contain "_" and "-"
+_DEVTO_COMMENT_ID_RE = re.compile(r'[A-Za-z0-9_-]{1,40}')
+# Twitter's rate-limit window; get_me() is not retried more often than this
+TWITTER_AUTH_RECHECK_SECONDS = 15 * 60
+# Upper bound on replies collected per conversation (search pages hold up to 100 tweets)
+TWITTER_MAX_REPLIES = 200
+# The Twitter user ID behind a set of credentials never changes, so it is kept across restarts
+TWITTER_USER_ID_CACHE_DIR = os.path.expanduser(os.getenv("TWITTER_USER_ID_CACHE_DIR", "~/.cache/ai-comm-specialist"))
+# How long a successful get_comments/get_post_status result is served from memory per post
+PLATFORM_COMMENTS_CACHE_TTL_SECONDS = float(os.getenv("PLATFORM_COMMENTS_CACHE_TTL_SECONDS", 30))
+PLATFORM_STATUS_CACHE_TTL_SECONDS = float(os.getenv("PLATFORM_STATUS_CACHE_TTL_SECONDS", 300))
+PLATFORM_RESULT_CACHE_MAX_ENTRIES = 1024
+# Articles whose parsed comment thread is kept for conditional (ETag) re-polling
+DEVTO_COMMENTS_CACHE_MAX_ENTRIES = 256
+
+def _pooled_session(headers: Dict[str, str]) -> requests.Session:
+    """Keep-alive HTTP session with default headers; only idempotent requests are retried"""
+    session = requests.Session()
+    session.headers.update(headers)
+    session.mount("https://", HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=10,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504], raise_on_status=False)
+    ))
+    return session
+
+def safe_return(error_message: str):
+    """Log and return a failed result dict when the wrapped platform call raises"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                logger.error(f"{error_message}: {e}")
+                return {"success": False, "error": str(e)}
+        return wrapper
+    return decorator
+
+def ttl_cached(ttl_seconds: float):
+    """Serve a successful per-post_id result from the instance cache for ttl_seconds.
+
+    Every caller gets its own deep copy, so mutating a returned comments list
+    cannot change what later callers are served.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, post_id, *args, **kwargs):
+            if ttl_seconds <= 0:
+                return func(self, post_id, *args, **kwargs)
+            key = (func.__name__, post_id, *args, *sorted(kwargs.items()))
+            with self._result_cache_lock:
+                hit = self._result_cache.get(key)
+            if hit and monotonic() - hit[0] < ttl_seconds:
+                return copy.deepcopy(hit[1])
+            result = func(self, post_id, *args, **kwargs)
+            if result.get("success"):
+                with self._result_cache_lock:
+                    self._result_cache[key] = (monotonic(), result)
+                    self._result_cache.move_to_end(key)
+                    if len(self._result_cache) > PLATFORM_RESULT_CACHE_MAX_ENTRIES:
+                        self._result_cache.popitem(last=False)
+                return copy.deepcopy(result)
+            return result
+        return wrapper
+    return decorator
+
 class SocialMediaPlatform(ABC):
     """Abstract base class for social media platforms"""
     
     def __init__(self):
         self.authenticated = False
+        # (method name, post_id) -> (monotonic time, result), see ttl_cached
+        self._result_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._result_cache_lock = threading.Lock()
     
     @abstractmethod
     def authenticate(self) -> bool:
@@ -38,6 +120,29 @@ class SocialMediaPlatform(ABC):
     def get_post_status(self, post_id: str) -> Dict[str, Any]:
         """Get the status of a post"""
         pass
+    
+    async def _run_blocking(self, func, *args, executor=None, **kwargs) -> Dict[str, Any]:
+        """Run a blocking platform call on an executor so the event loop stays free"""
+        return await asyncio.get_running_loop().run_in_executor(
+            executor,
+            functools.partial(func, *args, **kwargs)
+        )
+    
+    async def aschedule_post(self, content: str, scheduled_time: datetime, executor=None) -> Dict[str, Any]:
+        """Async counterpart of schedule_post"""
+        return await self._run_blocking(self.schedule_post, content, scheduled_time, executor=executor)
+    
+    async def aget_comments(self, post_id: str, executor=None) -> Dict[str, Any]:
+        """Async counterpart of get_comments"""
+        return await self._run_blocking(self.get_comments, post_id, executor=executor)
+    
+    async def arespond_to_comment(self, comment_id: str, response: str, *args, executor=None, **kwargs) -> Dict[str, Any]:
+        """Reply to a comment without blocking the event loop (runs the sync client on an executor)"""
+        return await self._run_blocking(self.respond_to_comment, comment_id, response, *args, executor=executor, **kwargs)
+    
+    async def aget_post_status(self, post_id: str, executor=None) -> Dict[str, Any]:
+        """Async counterpart of get_post_status"""
+        return await self._run_blocking(self.get_post_status, post_id, executor=executor)
 
 class LinkedInPlatform(SocialMediaPlatform):
     """LinkedIn platform integration"""
@@ -48,6 +153,10 @@ class LinkedInPlatform(SocialMediaPlatform):
         self.client_secret = settings.LINKEDIN_CLIENT_SECRET
         self.access_token = settings.LINKEDIN_ACCESS_TOKEN
         self.person_urn = settings.LINKEDIN_PERSON_URN
+        self._http = _pooled_session({
+            "Authorization": f"Bearer {self.access_token}",
+            "X-Restli-Protocol-Version": "2.0.0"
+        })
         self.authenticate()
     
     def authenticate(self) -> bool:
@@ -62,123 +171,100 @@ class LinkedInPlatform(SocialMediaPlatform):
             logger.error(f"LinkedIn authentication failed: {e}")
             return False
     
+    @safe_return("Error scheduling LinkedIn post")
     def schedule_post(self, content: str, scheduled_time: datetime) -> Dict[str, Any]:
-        try:
-            if not self.authenticated:
-                return {"success": False, "error": "Not authenticated"}
-            
-            # Validate person_urn or organization_urn format
-            if not self.person_urn:
-                return {"success": False, "error": "LinkedIn URN is not set. Please set LINKEDIN_PERSON_URN in your environment."}
-            if not (self.person_urn.startswith("urn:li:person:") or self.person_urn.startswith("urn:li:organization:")):
-                return {"success": False, "error": f"Invalid LinkedIn URN format: {self.person_urn}. It must start with 'urn:li:person:' or 'urn:li:organization:'"}
-            
-            url = "https://api.linkedin.com/v2/ugcPosts"
-            headers = {
-                "Authorization": f"Bearer {self.access_token}",
-                "X-Restli-Protocol-Version": "2.0.0",
-                "Content-Type": "application/json"
-            }
-            data = {
-                "author": self.person_urn,
-                "lifecycleState": "PUBLISHED",
-                "specificContent": {
-                    "com.linkedin.ugc.ShareContent": {
-                        "shareCommentary": {"text": content},
-                        "shareMediaCategory": "NONE"
-                    }
-                },
-                "visibility": {"com.linkedin.ugc.MemberNetworkVisibility": "PUBLIC"}
-            }
-            
-            logger.info(f"LinkedIn API request data: {data}")
-            response = requests.post(url, headers=headers, json=data)
-            
-            if response.status_code == 201:
-                post_id = response.json().get("id", "")
-                logger.info(f"LinkedIn post scheduled: {post_id}")
-                return {"success": True, "post_id": post_id}
-            else:
-                logger.error(f"LinkedIn post error: {response.status_code} - {response.text}")
-                return {"success": False, "error": response.text}
-        except Exception as e:
-            logger.error(f"Error scheduling LinkedIn post: {e}")
-            return {"success": False, "error": str(e)}
+        if not self.authenticated:
+            return {"success": False, "error": "Not authenticated"}
+        
+        # Validate person_urn or organization_urn format
+        if not self.person_urn:
+            return {"success": False, "error": "LinkedIn URN is not set. Please set LINKEDIN_PERSON_URN in your environment."}
+        if not (self.person_urn.startswith("urn:li:person:") or self.person_urn.startswith("urn:li:organization:")):
+            return {"success": False, "error": f"Invalid LinkedIn URN format: {self.person_urn}. It must start with 'urn:li:person:' or 'urn:li:organization:'"}
+        
+        url = "https://api.linkedin.com/v2/ugcPosts"
+        data = {
+            "author": self.person_urn,
+            "lifecycleState": "PUBLISHED",
+            "specificContent": {
+                "com.linkedin.ugc.ShareContent": {
+                    "shareCommentary": {"text": content},
+                    "shareMediaCategory": "NONE"
+                }
+            },
+            "visibility": {"com.linkedin.ugc.MemberNetworkVisibility": "PUBLIC"}
+        }
+        
+        logger.info(f"LinkedIn API request data: {data}")
+        response = self._http.post(url, json=data)
+        
+        if response.status_code == 201:
+            post_id = response.json().get("id", "")
+            logger.info(f"LinkedIn post scheduled: {post_id}")
+            return {"success": True, "post_id": post_id}
+        else:
+            logger.error(f"LinkedIn post error: {response.status_code} - {response.text}")
+            return {"success": False, "error": response.text}
     
+    @ttl_cached(PLATFORM_COMMENTS_CACHE_TTL_SECONDS)
+    @safe_return("Error getting LinkedIn comments")
     def get_comments(self, post_id: str) -> Dict[str, Any]:
-        try:
-            if not self.authenticated:
-                return {"success": False, "error": "Not authenticated"}
-            # LinkedIn API: Get comments for a post
-            url = f"https://api.linkedin.com/v2/socialActions/{post_id}/comments"
-            headers = {
-                "Authorization": f"Bearer {self.access_token}",
-                "X-Restli-Protocol-Version": "2.0.0"
-            }
-            response = requests.get(url, headers=headers)
-            if response.status_code == 200:
-                comments_data = response.json().get("elements", [])
-                comments = []
-                for c in comments_data:
-                    comments.append({
-                        "comment_id": c.get("id", ""),
-                        "user_name": c.get("actor", ""),
-                        "text": c.get("message", {}).get("text", ""),
-                        "timestamp": c.get("created", datetime.now().isoformat())
-                    })
-                return {"success": True, "comments": comments}
-            else:
-                logger.error(f"LinkedIn get comments error: {response.text}")
-                return {"success": False, "error": response.text}
-        except Exception as e:
-            logger.error(f"Error getting LinkedIn comments: {e}")
-            return {"success": False, "error": str(e)}
+        if not self.authenticated:
+            return {"success": False, "error": "Not authenticated"}
+        # LinkedIn API: Get comments for a post
+        url = f"https://api.linkedin.com/v2/socialActions/{post_id}/comments"
+        response = self._http.get(url)
+        if response.status_code == 200:
+            comments_data = response.json().get("elements", [])
+            fallback_ts = datetime.now().isoformat()  # Formatted once per call, not per comment
+            comments = [
+                {
+                    "comment_id": c.get("id", ""),
+                    "user_name": c.get("actor", ""),
+                    "text": (c.get("message") or {}).get("text", ""),
+                    "timestamp": c.get("created") or fallback_ts
+                }
+                for c in comments_data
+            ]
+            return {"success": True, "comments": comments}
+        else:
+            logger.error(f"LinkedIn get comments error: {response.text}")
+            return {"success": False, "error": response.text}
     
+    @safe_return("Error replying to LinkedIn comment")
     def respond_to_comment(self, comment_id: str, response: str) -> Dict[str, Any]:
-        try:
-            if not self.authenticated:
-                return {"success": False, "error": "Not authenticated"}
-            url = f"https://api.linkedin.com/v2/socialActions/{comment_id}/comments"
-            headers = {
-                "Authorization": f"Bearer {self.access_token}",
-                "X-Restli-Protocol-Version": "2.0.0",
-                "Content-Type": "application/json"
-            }
-            data = {"actor": self.person_urn, "message": {"text": response}}
-            resp = requests.post(url, headers=headers, json=data)
-            if resp.status_code == 201:
-                comment_id = resp.json().get("id", "")
-                logger.info(f"LinkedIn comment reply sent: {comment_id}")
-                return {"success": True, "response_id": comment_id}
-            else:
-                logger.error(f"LinkedIn reply error: {resp.text}")
-                return {"success": False, "error": resp.text}
-        except Exception as e:
-            logger.error(f"Error replying to LinkedIn comment: {e}")
-            return {"success": False, "error": str(e)}
+        if not self.authenticated:
+            return {"success": False, "error": "Not authenticated"}
+        url = f"https://api.linkedin.com/v2/socialActions/{comment_id}/comments"
+        data = {"actor": self.person_urn, "message": {"text": response}}
+        resp = self._http.post(url, json=data)
+        if resp.status_code == 201:
+            comment_id = resp.json().get("id", "")
+            logger.info(f"LinkedIn comment reply sent: {comment_id}")
+            return {"success": True, "response_id": comment_id}
+        else:
+            logger.error(f"LinkedIn reply error: {resp.text}")
+            return {"success": False, "error": resp.text}
     
+    @ttl_cached(PLATFORM_STATUS_CACHE_TTL_SECONDS)
+    @safe_return("Error getting LinkedIn post status")
     def get_post_status(self, post_id: str) -> Dict[str, Any]:
         """Get LinkedIn post status"""
-        try:
-            if not self.authenticated:
-                return {"success": False, "error": "Not authenticated"}
-            
-            # Simulate getting post status
-            status_data = {
-                "post_id": post_id,
-                "status": "published",
-                "engagement": {
-                    "likes": 25,
-                    "comments": 8,
-                    "shares": 3
-                }
+        if not self.authenticated:
+            return {"success": False, "error": "Not authenticated"}
+        
+        # Simulate getting post status
+        status_data = {
+            "post_id": post_id,
+            "status": "published",
+            "engagement": {
+                "likes": 25,
+                "comments": 8,
+                "shares": 3
             }
-            
-            return {"success": True, "status": status_data}
-            
-        except Exception as e:
-            logger.error(f"Error getting LinkedIn post status: {e}")
-            return {"success": False, "error": str(e)}
+        }
+        
+        return {"success": True, "status": status_data}
 
 class TwitterPlatform(SocialMediaPlatform):
     """Twitter/X platform integration using Tweepy v2 Client"""
@@ -187,9 +273,49 @@ class TwitterPlatform(SocialMediaPlatform):
         super().__init__()
         self.client = None
         self.user_id = None
+        self._auth_checked_at = None  # monotonic time of the last get_me() attempt
         self.authenticated = False  # Do not authenticate at startup
         # self.authenticate()  # Removed to avoid blocking API calls at startup
     
+    def _user_id_cache_path(self) -> Optional[str]:
+        """Per-credential file holding the user ID returned by get_me()"""
+        token = settings.TWITTER_ACCESS_TOKEN or settings.TWITTER_BEARER_TOKEN
+        if not token:
+            return None
+        digest = hashlib.sha256(token.encode()).hexdigest()[:12]
+        return os.path.join(TWITTER_USER_ID_CACHE_DIR, f"twitter_user_id_{digest}")
+    
+    def _load_cached_user_id(self) -> Optional[int]:
+        path = self._user_id_cache_path()
+        try:
+            with open(path) as f:
+                return int(f.read().strip())
+        except (TypeError, OSError, ValueError):
+            return None
+    
+    def _store_cached_user_id(self):
+        path = self._user_id_cache_path()
+        if not path:
+            return
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as f:
+                f.write(str(self.user_id))
+        except OSError as e:
+            logger.warning(f"⚠️ Could not cache Twitter user ID: {e}")
+    
+    def _invalidate_auth(self):
+        """Drop the cached user ID after a 401 so the next call re-authenticates with get_me()"""
+        path = self._user_id_cache_path()
+        if path:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self.authenticated = False
+        self.user_id = None
+        self._auth_checked_at = None
+    
     def authenticate(self) -> bool:
         try:
             # Create v2 client for Twitter API v2
@@ -202,13 +328,23 @@ class TwitterPlatform(SocialMediaPlatform):
                 wait_on_rate_limit=True  # Automatically handle rate limits
             )
             
+            # Skip get_me() when this credential set's user ID is already known
+            cached_user_id = self._load_cached_user_id()
+            if cached_user_id:
+                self.user_id = cached_user_id
+                self.authenticated = True
+                logger.info(f"✅ Twitter v2 authenticated from cached user ID: {self.user_id}")
+                return True
+            
             # Try to get user info (may fail due to rate limits)
+            self._auth_checked_at = monotonic()
             try:
                 user = self.client.get_me()
                 self.user_id = user.data.id if user and user.data else None
                 self.authenticated = self.user_id is not None
                 if self.authenticated:
                     logger.info(f"✅ Twitter v2 authentication successful. User ID: {self.user_id}")
+                    self._store_cached_user_id()
                 else:
                     logger.error("❌ Twitter v2 authentication failed: Could not fetch user ID.")
             except tweepy.TooManyRequests as rate_limit_error:
@@ -226,122 +362,134 @@ class TwitterPlatform(SocialMediaPlatform):
             logger.error(f"❌ Twitter v2 authentication failed: {e}")
             return False
     
+    @safe_return("Error scheduling Twitter v2 post")
     def schedule_post(self, content: str, scheduled_time: datetime) -> Dict[str, Any]:
+        # Authenticate if not already authenticated, or retry get_me() for a missing
+        # user_id once the rate-limit window that caused it has passed
+        if not self.authenticated or (
+            not self.user_id
+            and (self._auth_checked_at is None
+                 or monotonic() - self._auth_checked_at > TWITTER_AUTH_RECHECK_SECONDS)
+        ):
+            self.authenticate()
+        if not self.authenticated or not self.user_id:
+            return {"success": False, "error": "Not authenticated or missing user ID"}
         try:
-            # Authenticate if not already authenticated or user_id is missing
-            if not self.authenticated or not self.user_id:
-                self.authenticate()
-            if not self.authenticated or not self.user_id:
-                return {"success": False, "error": "Not authenticated or missing user ID"}
             response = self.client.create_tweet(text=content, user_auth=True)
-            tweet_id = response.data.get("id") if response.data else None
-            logger.info(f"Twitter v2 post scheduled: {tweet_id}")
-            return {"success": True, "post_id": str(tweet_id)}
-        except Exception as e:
-            logger.error(f"Error scheduling Twitter v2 post: {e}")
-            return {"success": False, "error": str(e)}
+        except tweepy.Unauthorized:
+            self._invalidate_auth()
+            raise
+        tweet_id = response.data.get("id") if response.data else None
+        logger.info(f"Twitter v2 post scheduled: {tweet_id}")
+        return {"success": True, "post_id": str(tweet_id)}
     
-    def get_comments(self, post_id: str) -> Dict[str, Any]:
-        try:
-            if not self.authenticated:
-                self.authenticate()
-            if not self.authenticated:
-                return {"success": False, "error": "Not authenticated"}
+    @ttl_cached(PLATFORM_COMMENTS_CACHE_TTL_SECONDS)
+    @safe_return("Error fetching Twitter replies")
+    def get_comments(self, post_id: str, limit: int = TWITTER_MAX_REPLIES) -> Dict[str, Any]:
+        if not self.authenticated:
+            self.authenticate()
+        if not self.authenticated:
+            return {"success": False, "error": "Not authenticated"}
 
-            # Twitter API v2: Fetch replies using conversation_id
-            query = f"conversation_id:{post_id}"
-            try:
-                response = self.client.search_recent_tweets(
-                    query=query,
-                    tweet_fields=["author_id", "created_at", "conversation_id"],
-                    expansions=["author_id"],
-                    max_results=50  # Twitter API max is 100; use 50 to be safe
-                )
-                tweets = response.data if response and response.data else []
-                users = {u.id: u for u in response.includes["users"]} if response and hasattr(response, "includes") and "users" in response.includes else {}
-                comments = []
-                for tweet in tweets:
-                    user = users.get(tweet.author_id) if users else None
+        # Twitter API v2: Fetch replies using conversation_id
+        query = f"conversation_id:{post_id}"
+        try:
+            # Page through the whole conversation lazily, stopping once `limit` replies are collected
+            paginator = tweepy.Paginator(
+                self.client.search_recent_tweets,
+                query=query,
+                tweet_fields=["author_id", "created_at", "conversation_id"],
+                expansions=["author_id"],
+                max_results=100  # Twitter API max per page
+            )
+            # author_id -> username, merged once per page instead of probing each tweet's user
+            user_names = {}
+            comments = []
+            for response in paginator:
+                includes = getattr(response, "includes", None) or {}
+                user_names.update((u.id, getattr(u, "username", None)) for u in includes.get("users", ()))
+                for tweet in response.data or ():
+                    created_at = tweet.created_at
                     comments.append({
                         "comment_id": str(tweet.id),
-                        "user_name": user.username if user and hasattr(user, "username") else str(tweet.author_id),
+                        "user_name": user_names.get(tweet.author_id) or str(tweet.author_id),
                         "text": tweet.text,
-                        "timestamp": tweet.created_at.isoformat() if hasattr(tweet, "created_at") and tweet.created_at else ""
+                        "timestamp": created_at.isoformat() if created_at else ""
                     })
-                return {"success": True, "comments": comments}
-            except tweepy.TooManyRequests as rate_limit_error:
-                logger.warning(f"⚠️ Twitter rate limited when fetching comments: {rate_limit_error}")
-                return {
-                    "success": False,
-                    "error": "Twitter rate limit exceeded",
-                    "details": "Please wait before trying to fetch comments again",
-                    "retry_after": "15 minutes"
-                }
-        except Exception as api_error:
-            logger.error(f"Error fetching Twitter replies: {api_error}")
-            return {"success": False, "error": str(api_error)}
+                    if len(comments) >= limit:
+                        return {"success": True, "comments": comments}
+            return {"success": True, "comments": comments}
+        except tweepy.Unauthorized:
+            self._invalidate_auth()
+            raise
+        except tweepy.TooManyRequests as rate_limit_error:
+            logger.warning(f"⚠️ Twitter rate limited when fetching comments: {rate_limit_error}")
+            return {
+                "success": False,
+                "error": "Twitter rate limit exceeded",
+                "details": "Please wait before trying to fetch comments again",
+                "retry_after": "15 minutes"
+            }
     
+    @safe_return("❌ Error replying to Twitter comment")
     def respond_to_comment(self, comment_id: str, response: str, *args, **kwargs) -> Dict[str, Any]:
+        if not self.authenticated:
+            logger.error(f"❌ Not authenticated. comment_id={comment_id}")
+            return {"success": False, "error": "Not authenticated"}
+        # Tweet IDs are numeric; skip the str() round-trip for the usual string IDs
+        if not comment_id or not (isinstance(comment_id, int) or comment_id.isdigit()):
+            logger.error(f"❌ Invalid or missing comment_id: {comment_id}")
+            return {"success": False, "error": "Invalid or missing comment_id"}
+        
+        # Use v2 API for posting replies
         try:
-            if not self.authenticated:
-                logger.error(f"❌ Not authenticated. comment_id={comment_id}")
-                return {"success": False, "error": "Not authenticated"}
-            if not comment_id or not str(comment_id).isalnum():
-                logger.error(f"❌ Invalid or missing comment_id: {comment_id}")
-                return {"success": False, "error": "Invalid or missing comment_id"}
-            
-            # Use v2 API for posting replies
-            try:
-                reply = self.client.create_tweet(text=response, in_reply_to_tweet_id=comment_id)
-                response_id = str(reply.data.id) if reply and reply.data else None
-                if response_id:
-                    logger.info(f"✅ Twitter reply sent successfully: {response_id}")
-                    return {"success": True, "response_id": response_id}
-                else:
-                    logger.error("❌ Twitter reply failed: No response ID returned")
-                    return {"success": False, "error": "No response ID returned"}
-                    
-            except tweepy.TooManyRequests as rate_limit_error:
-                logger.warning(f"⚠️ Twitter rate limited when replying to comment: {rate_limit_error}")
-                return {
-                    "success": False, 
-                    "error": "Twitter rate limit exceeded",
-                    "details": "Please wait before trying to reply again",
-                    "retry_after": "15 minutes"
-                }
-            except tweepy.Forbidden as forbidden_error:
-                logger.error(f"❌ Twitter forbidden error: {forbidden_error}")
-                return {"success": False, "error": "Twitter API access forbidden"}
-            except tweepy.NotFound as not_found_error:
-                logger.error(f"❌ Twitter comment not found: {not_found_error}")
-                return {"success": False, "error": "Comment not found or deleted"}
+            reply = self.client.create_tweet(text=response, in_reply_to_tweet_id=comment_id)
+            response_id = str(reply.data.id) if reply and reply.data else None
+            if response_id:
+                logger.info(f"✅ Twitter reply sent successfully: {response_id}")
+                return {"success": True, "response_id": response_id}
+            else:
+                logger.error("❌ Twitter reply failed: No response ID returned")
+                return {"success": False, "error": "No response ID returned"}
                 
-        except Exception as e:
-            logger.error(f"❌ Error replying to Twitter comment: {e}")
-            return {"success": False, "error": str(e)}
+        except tweepy.TooManyRequests as rate_limit_error:
+            logger.warning(f"⚠️ Twitter rate limited when replying to comment: {rate_limit_error}")
+            return {
+                "success": False, 
+                "error": "Twitter rate limit exceeded",
+                "details": "Please wait before trying to reply again",
+                "retry_after": "15 minutes"
+            }
+        except tweepy.Unauthorized as unauthorized_error:
+            logger.error(f"❌ Twitter credentials rejected: {unauthorized_error}")
+            self._invalidate_auth()
+            return {"success": False, "error": "Twitter authentication failed"}
+        except tweepy.Forbidden as forbidden_error:
+            logger.error(f"❌ Twitter forbidden error: {forbidden_error}")
+            return {"success": False, "error": "Twitter API access forbidden"}
+        except tweepy.NotFound as not_found_error:
+            logger.error(f"❌ Twitter comment not found: {not_found_error}")
+            return {"success": False, "error": "Comment not found or deleted"}
     
+    @ttl_cached(PLATFORM_STATUS_CACHE_TTL_SECONDS)
+    @safe_return("Error getting Twitter post status")
     def get_post_status(self, post_id: str) -> Dict[str, Any]:
         """Get Twitter post status"""
-        try:
-            if not self.authenticated:
-                return {"success": False, "error": "Not authenticated"}
-            
-            # Simulate getting post status
-            status_data = {
-                "post_id": post_id,
-                "status": "published",
-                "engagement": {
-                    "likes": 15,
-                    "retweets": 5,
-                    "replies": 3
-                }
+        if not self.authenticated:
+            return {"success": False, "error": "Not authenticated"}
+        
+        # Simulate getting post status
+        status_data = {
+            "post_id": post_id,
+            "status": "published",
+            "engagement": {
+                "likes": 15,
+                "retweets": 5,
+                "replies": 3
             }
-            
-            return {"success": True, "status": status_data}
-            
-        except Exception as e:
-            logger.error(f"Error getting Twitter post status: {e}")
-            return {"success": False, "error": str(e)}
+        }
+        
+        return {"success": True, "status": status_data}
 
 class DevToPlatform(SocialMediaPlatform):
     """Dev.to platform integration"""
@@ -351,6 +499,10 @@ class DevToPlatform(SocialMediaPlatform):
         self.api_key = settings.DEVTO_API_KEY
         self.username = settings.DEVTO_USERNAME
         self.base_url = "https://dev.to/api"
+        self._http = _pooled_session({"api-key": self.api_key or ""})
+        # post_id -> (validator headers, parsed comments) for If-None-Match/If-Modified-Since polls
+        self._comments_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._comments_cache_lock = threading.Lock()
         self.authenticate()
     
     def authenticate(self) -> bool:
@@ -362,208 +514,256 @@ class DevToPlatform(SocialMediaPlatform):
             logger.warning("Dev.to API key not configured")
             return False
     
+    @safe_return("Error publishing Dev.to article")
     def schedule_post(self, content: str, scheduled_time: datetime) -> Dict[str, Any]:
-        try:
-            if not self.authenticated:
-                return {"success": False, "error": "Not authenticated"}
-            
-            # Dev.to API: Create an article
-            url = f"{self.base_url}/articles"
-            headers = {
-                "api-key": self.api_key,
-                "Content-Type": "application/json"
-            }
-            
-            # Parse content to extract title and body
-            lines = content.split('\n')
-            title = lines[0].strip() if lines else "New Article"
-            body = '\n'.join(lines[1:]).strip() if len(lines) > 1 else content
-            
-            # Extract tags from content (look for hashtags)
-            import re
-            tags = re.findall(r'#(\w+)', content)
-            tags = tags[:4]  # Limit to 4 tags as per Dev.to API requirement
-            
-            data = {
-                "article": {
-                    "title": title,
-                    "body_markdown": body,
-                    "published": True,
-                    "tags": tags
-                }
+        if not self.authenticated:
+            return {"success": False, "error": "Not authenticated"}
+        
+        # Dev.to API: Create an article
+        url = f"{self.base_url}/articles"
+        
+        # Parse content to extract title and body
+        first_line, newline, rest = content.partition('\n')
+        title = first_line.strip()
+        body = rest.strip() if newline else content
+        
+        # Extract tags from content (look for hashtags)
+        tags = _HASHTAG_RE.findall(content)[:4]  # Limit to 4 tags as per Dev.to API requirement
+        
+        data = {
+            "article": {
+                "title": title,
+                "body_markdown": body,
+                "published": True,
+                "tags": tags
             }
-            
-            response = requests.post(url, headers=headers, json=data)
-            
-            if response.status_code == 201:
-                article_data = response.json()
-                post_id = str(article_data.get("id", ""))
-                logger.info(f"Dev.to article published: {post_id}")
-                return {"success": True, "post_id": post_id}
-            else:
-                logger.error(f"Dev.to post error: {response.text}")
-                return {"success": False, "error": response.text}
-                
-        except Exception as e:
-            logger.error(f"Error publishing Dev.to article: {e}")
-            return {"success": False, "error": str(e)}
+        }
+        
+        response = self._http.post(url, json=data)
+        
+        if response.status_code == 201:
+            article_data = response.json()
+            post_id = str(article_data.get("id", ""))
+            logger.info(f"Dev.to article published: {post_id}")
+            return {"success": True, "post_id": post_id}
+        else:
+            logger.error(f"Dev.to post error: {response.text}")
+            return {"success": False, "error": response.text}
     
+    @ttl_cached(PLATFORM_COMMENTS_CACHE_TTL_SECONDS)
+    @safe_return("Error getting Dev.to comments")
     def get_comments(self, post_id: str) -> Dict[str, Any]:
-        try:
-            if not self.authenticated:
-                return {"success": False, "error": "Not authenticated"}
-            
-            # Dev.to API: Get comments for an article
-            url = f"{self.base_url}/comments"
-            headers = {
-                "api-key": self.api_key
-            }
-            params = {
-                "a_id": post_id
-            }
-            
-            response = requests.get(url, headers=headers, params=params)
-            
-            if response.status_code == 200:
-                comments_data = response.json()
-                logger.info(f"Raw Dev.to comments API response: {comments_data}")
-                comments = []
-                def extract_comments(comment_list):
-                    for c in comment_list:
-                        comment_id = str(c.get("id", ""))
-                        if not comment_id:
-                            comment_id = str(c.get("id_code", ""))  # Use id_code if id is missing
-                        comments.append({
-                            "comment_id": comment_id,
-                            "user_name": c.get("user", {}).get("username", ""),
-                            "text": c.get("body_html", ""),
-                            "timestamp": c.get("created_at", datetime.now().isoformat()),
-                            "parent_id": c.get("parent_id") if "parent_id" in c else None
-                        })
-                        # Recursively extract children if present
-                        if "children" in c and isinstance(c["children"], list):
-                            extract_comments(c["children"])
-                extract_comments(comments_data)
-                return {"success": True, "comments": comments}
-            else:
-                logger.error(f"Dev.to get comments error: {response.text}")
-                return {"success": False, "error": response.text}
-                
-        except Exception as e:
-            logger.error(f"Error getting Dev.to comments: {e}")
-            return {"success": False, "error": str(e)}
+        if not self.authenticated:
+            return {"success": False, "error": "Not authenticated"}
+        
+        # Dev.to API: Get comments for an article
+        url = f"{self.base_url}/comments"
+        params = {
+            "a_id": post_id
+        }
+        
+        with self._comments_cache_lock:
+            cached = self._comments_cache.get(post_id)
+        response = self._http.get(url, params=params, headers=cached[0] if cached else None)
+        
+        if response.status_code == 304 and cached:
+            # Thread unchanged since the last poll; reuse the parsed comments
+            return {"success": True, "comments": list(cached[1])}
+        if response.status_code == 200:
+            comments_data = response.json()
+            logger.info(f"Raw Dev.to comments API response: {comments_data}")
+            comments = []
+            append = comments.append
+            fallback_ts = None  # datetime.now() is only formatted if a comment lacks created_at
+            # Walk the comment tree depth-first with an explicit stack, keeping thread order
+            stack = list(reversed(comments_data))
+            while stack:
+                c = stack.pop()
+                comment_id = str(c.get("id", ""))
+                if not comment_id:
+                    comment_id = str(c.get("id_code", ""))  # Use id_code if id is missing
+                user = c.get("user")
+                timestamp = c.get("created_at")
+                if timestamp is None:
+                    fallback_ts = fallback_ts or datetime.now().isoformat()
+                    timestamp = fallback_ts
+                append({
+                    "comment_id": comment_id,
+                    "user_name": user.get("username", "") if user else "",
+                    "text": c.get("body_html", ""),
+                    "timestamp": timestamp,
+                    "parent_id": c.get("parent_id")
+                })
+                # Children are visited before the next sibling
+                children = c.get("children")
+                if isinstance(children, list):
+                    stack.extend(reversed(children))
+            validators = {}
+            if response.headers.get("ETag"):
+                validators["If-None-Match"] = response.headers["ETag"]
+            if response.headers.get("Last-Modified"):
+                validators["If-Modified-Since"] = response.headers["Last-Modified"]
+            with self._comments_cache_lock:
+                if validators:
+                    self._comments_cache[post_id] = (validators, comments)
+                    self._comments_cache.move_to_end(post_id)
+                    if len(self._comments_cache) > DEVTO_COMMENTS_CACHE_MAX_ENTRIES:
+                        self._comments_cache.popitem(last=False)
+                else:
+                    self._comments_cache.pop(post_id, None)
+            return {"success": True, "comments": list(comments)}
+        else:
+            logger.error(f"Dev.to get comments error: {response.text}")
+            return {"success": False, "error": response.text}
     
+    async def get_comments_bulk(self, post_ids: List[str], executor=None) -> Dict[str, Dict[str, Any]]:
+        """Fetch comments for several articles concurrently (duplicate IDs are fetched once)"""
+        unique_ids = list(dict.fromkeys(post_ids))
+        results = await asyncio.gather(
+            *(self.aget_comments(post_id, executor=executor) for post_id in unique_ids),
+            return_exceptions=True
+        )
+        return {
+            post_id: {"success": False, "error": str(result)} if isinstance(result, Exception) else result
+            for post_id, result in zip(unique_ids, results)
+        }
+    
+    @safe_return("❌ Dev.to reply exception")
     def respond_to_comment(self, comment_id: str, response: str, *args, **kwargs) -> Dict[str, Any]:
-        try:
-            if not self.authenticated:
-                return {"success": False, "error": "Not authenticated"}
-            if not comment_id or not str(comment_id).isalnum():
-                return {"success": False, "error": "Invalid or missing comment_id"}
+        if not self.authenticated:
+            return {"success": False, "error": "Not authenticated"}
+        if not comment_id or not (isinstance(comment_id, int) or _DEVTO_COMMENT_ID_RE.fullmatch(comment_id)):
+            return {"success": False, "error": "Invalid or missing comment_id"}
 
-            # IMPORTANT: Dev.to/Forem API does not provide a public endpoint for posting comments
-            # The API only supports reading comments, not creating them
-            # This is a limitation of the Dev.to platform's public API
-            
-            logger.warning(f"⚠️ Dev.to comment reply attempted but API doesn't support posting comments")
-            return {
-                "success": False, 
-                "error": "Dev.to API limitation: Comment posting not supported",
-                "details": "The Dev.to/Forem API does not provide a public endpoint for posting comments. Only reading comments is supported.",
-                "suggestion": "Consider using the web interface or contact Dev.to support for comment posting capabilities."
-            }
-
-        except Exception as e:
-            logger.error(f"❌ Dev.to reply exception: {str(e)}")
-            return {"success": False, "error": str(e)}
+        # IMPORTANT: Dev.to/Forem API does not provide a public endpoint for posting comments
+        # The API only supports reading comments, not creating them
+        # This is a limitation of the Dev.to platform's public API
+        
+        logger.warning(f"⚠️ Dev.to comment reply attempted but API doesn't support posting comments")
+        return {
+            "success": False, 
+            "error": "Dev.to API limitation: Comment posting not supported",
+            "details": "The Dev.to/Forem API does not provide a public endpoint for posting comments. Only reading comments is supported.",
+            "suggestion": "Consider using the web interface or contact Dev.to support for comment posting capabilities."
+        }
     
+    @ttl_cached(PLATFORM_STATUS_CACHE_TTL_SECONDS)
+    @safe_return("Error getting Dev.to article status")
     def get_post_status(self, post_id: str) -> Dict[str, Any]:
         """Get Dev.to article status"""
-        try:
-            if not self.authenticated:
-                return {"success": False, "error": "Not authenticated"}
-            
-            # Dev.to API: Get article details
-            url = f"{self.base_url}/articles/{post_id}"
-            headers = {
-                "api-key": self.api_key
-            }
-            
-            response = requests.get(url, headers=headers)
-            
-            if response.status_code == 200:
-                article_data = response.json()
-                status_data = {
-                    "post_id": post_id,
-                    "status": "published" if article_data.get("published") else "draft",
-                    "engagement": {
-                        "likes": article_data.get("public_reactions_count", 0),
-                        "comments": article_data.get("comments_count", 0),
-                        "views": article_data.get("page_views_count", 0)
-                    }
+        if not self.authenticated:
+            return {"success": False, "error": "Not authenticated"}
+        
+        # Dev.to API: Get article details
+        url = f"{self.base_url}/articles/{post_id}"
+        
+        response = self._http.get(url)
+        
+        if response.status_code == 200:
+            article_data = response.json()
+            status_data = {
+                "post_id": post_id,
+                "status": "published" if article_data.get("published") else "draft",
+                "engagement": {
+                    "likes": article_data.get("public_reactions_count", 0),
+                    "comments": article_data.get("comments_count", 0),
+                    "views": article_data.get("page_views_count", 0)
                 }
-                return {"success": True, "status": status_data}
-            else:
-                logger.error(f"Dev.to get article error: {response.text}")
-                return {"success": False, "error": response.text}
-                
-        except Exception as e:
-            logger.error(f"Error getting Dev.to article status: {e}")
-            return {"success": False, "error": str(e)}
+            }
+            return {"success": True, "status": status_data}
+        else:
+            logger.error(f"Dev.to get article error: {response.text}")
+            return {"success": False, "error": response.text}
     
+    @safe_return("Error getting Dev.to articles")
     def get_user_articles(self, count: int = 10) -> Dict[str, Any]:
         """Get user's articles (additional method for Dev.to)"""
-        try:
-            if not self.authenticated:
-                return {"success": False, "error": "Not authenticated"}
-            
-            url = f"{self.base_url}/articles/me"
-            headers = {
-                "api-key": self.api_key
-            }
-            params = {
-                "per_page": count
-            }
-            
-            response = requests.get(url, headers=headers, params=params)
-            
-            if response.status_code == 200:
-                articles_data = response.json()
-                articles = []
-                for article in articles_data:
-                    articles.append({
-                        "article_id": str(article.get("id", "")),
-                        "title": article.get("title", ""),
-                        "published_at": article.get("published_at", ""),
-                        "tags": article.get("tag_list", []),
-                        "reactions_count": article.get("public_reactions_count", 0),
-                        "comments_count": article.get("comments_count", 0)
-                    })
-                return {"success": True, "articles": articles}
-            else:
-                logger.error(f"Dev.to get articles error: {response.text}")
-                return {"success": False, "error": response.text}
-                
-        except Exception as e:
-            logger.error(f"Error getting Dev.to articles: {e}")
-            return {"success": False, "error": str(e)}
+        if not self.authenticated:
+            return {"success": False, "error": "Not authenticated"}
+        
+        url = f"{self.base_url}/articles/me"
+        params = {
+            "per_page": count
+        }
+        
+        response = self._http.get(url, params=params)
+        
+        if response.status_code == 200:
+            articles_data = response.json()
+            articles = []
+            for article in articles_data:
+                articles.append({
+                    "article_id": str(article.get("id", "")),
+                    "title": article.get("title", ""),
+                    "published_at": article.get("published_at", ""),
+                    "tags": article.get("tag_list", []),
+                    "reactions_count": article.get("public_reactions_count", 0),
+                    "comments_count": article.get("comments_count", 0)
+                })
+            return {"success": True, "articles": articles}
+        else:
+            logger.error(f"Dev.to get articles error: {response.text}")
+            return {"success": False, "error": response.text}
 
 class SocialMediaManager:
     """Manager for all social media platforms"""
     
     def __init__(self):
-        self.platforms = {
-            "linkedin": LinkedInPlatform(),
-            "twitter": TwitterPlatform(),
-            "devto": DevToPlatform()
+        # Platforms are constructed (and authenticated) on first use
+        self._factories = {
+            "linkedin": LinkedInPlatform,
+            "twitter": TwitterPlatform,
+            "devto": DevToPlatform
         }
+        self._instances: Dict[str, SocialMediaPlatform] = {}
+        self._lock = threading.Lock()
+    
+    @property
+    def platforms(self) -> Dict[str, SocialMediaPlatform]:
+        """All platform instances, constructing any that haven't been used yet"""
+        instances = ((name, self.get_platform(name)) for name in self._factories)
+        return {name: platform for name, platform in instances if platform is not None}
     
     def get_platform(self, platform_name: str) -> Optional[SocialMediaPlatform]:
         """Get a specific platform instance"""
-        return self.platforms.get(platform_name.lower())
+        key = platform_name.lower()
+        platform = self._instances.get(key)
+        if platform is None and key in self._factories:
+            with self._lock:
+                platform = self._instances.get(key)
+                if platform is None:
+                    try:
+                        platform = self._instances[key] = self._factories[key]()
+                    except Exception as e:
+                        # A misconfigured platform must not take the others down; retried on next use
+                        logger.error(f"Error initializing {key} platform: {e}")
+        return platform
     
     def get_available_platforms(self) -> List[str]:
         """Get list of available platforms"""
-        return list(self.platforms.keys())
+        return list(self._factories)
+    
+    async def _gather_per_platform(self, method: str, ids: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+        """Call an async platform method for every platform concurrently; failures stay per-platform"""
+        async def call(name: str, post_id: str) -> Dict[str, Any]:
+            platform = self.get_platform(name)
+            if platform is None:
+                return {"success": False, "error": f"Unknown platform: {name}"}
+            return await getattr(platform, method)(post_id)
+        
+        results = await asyncio.gather(*(call(name, post_id) for name, post_id in ids.items()), return_exceptions=True)
+        return {
+            name: {"success": False, "error": str(result)} if isinstance(result, Exception) else result
+            for name, result in zip(ids, results)
+        }
+    
+    async def get_all_post_statuses(self, ids: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+        """Get post status on several platforms at once ({platform: post_id})"""
+        return await self._gather_per_platform("aget_post_status", ids)
+    
+    async def get_all_comments(self, ids: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+        """Get comments from several platforms at once ({platform: post_id})"""
+        return await self._gather_per_platform("aget_comments", ids)
     
     def get_authenticated_platforms(self) -> List[str]:
         """Get list of authenticated platforms"""
@@ -8,7 +8,7 @@ the API server and the web dashboard.
 
 import uvicorn
 import logging
-from app.main import app
+from app.config import settings
 from app.database import create_tables, init_db
 
 # Configure logging
@@ -30,11 +30,13 @@ def main():
         
         # Start the FastAPI server
         logger.info("Starting FastAPI server...")
+        # Import string so the app is only loaded in the server process (required for reload).
+        # A single worker: each worker process would start its own comment/publish scheduler.
         uvicorn.run(
-            app,
-            host="0.0.0.0",
-            port=8000,
-            reload=True,
+            "app.main:app",
+            host=settings.HOST,
+            port=settings.PORT,
+            reload=settings.RELOAD,
             log_level="info"
         )
         
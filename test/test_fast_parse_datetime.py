@@ -0,0 +1,117 @@
+"""
+Tests for the schedule-time fast path in AICommunicationAgent.
+
+_fast_parse_datetime only handles inputs that are entirely one date/time
+phrase; everything else must return None so the AI model interprets it.
+"""
+
+import os
+import sys
+from datetime import date, datetime
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import ai_agent
+from app.ai_agent import AICommunicationAgent, IST
+
+NOW = datetime(2026, 10, 15, 9, 0)
+parse = AICommunicationAgent._fast_parse_datetime
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("2026-12-01 10:00", datetime(2026, 12, 1, 10, 0)),
+    ("2026-12-01t10:00", datetime(2026, 12, 1, 10, 0)),
+    ("today at 2 pm", datetime(2026, 10, 15, 14, 0)),
+    ("tomorrow at 3 pm", datetime(2026, 10, 16, 15, 0)),
+    ("tomorrow at 3:30", datetime(2026, 10, 16, 3, 30)),
+    ("tonight at 9:15", datetime(2026, 10, 15, 21, 15)),
+    ("  today at 2 pm  ", datetime(2026, 10, 15, 14, 0)),
+    ("8:18 am", datetime(2026, 10, 15, 8, 18)),
+    ("at 5 pm", datetime(2026, 10, 15, 17, 0)),
+])
+def test_whole_input_matches(text, expected):
+    assert parse(text, NOW) == expected
+
+
+@pytest.mark.parametrize("text", [
+    "the day after tomorrow at 3 pm",
+    "starts tomorrow at 6 pm, post it today at 9:30 am",
+    "promote the 2026-12-01 10:00 meetup, post tomorrow at 9 am",
+    "not tomorrow at 3 pm",
+    "tomorrow at 3 pm please",
+    "next monday",
+])
+def test_extra_words_fall_through_to_model(text):
+    assert parse(text, NOW) is None
+
+
+@pytest.mark.parametrize("text", ["tomorrow at 3", "tonight at 9", "at 5", "5"])
+def test_ambiguous_hour_falls_through_to_model(text):
+    assert parse(text, NOW) is None
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("12 am", datetime(2026, 10, 15, 0, 0)),
+    ("12:30 am", datetime(2026, 10, 15, 0, 30)),
+    ("12 pm", datetime(2026, 10, 15, 12, 0)),
+    ("tomorrow at 12 am", datetime(2026, 10, 16, 0, 0)),
+])
+def test_midnight_and_noon(text, expected):
+    assert parse(text, NOW) == expected
+
+
+@pytest.mark.parametrize("text", [
+    "2026-02-30 10:00",
+    "2026-13-01 10:00",
+    "2026-12-01 24:00",
+    "13 pm",
+    "0 am",
+    "25:00",
+    "today at 9:75",
+])
+def test_invalid_dates_and_times(text):
+    assert parse(text, NOW) is None
+
+
+class _FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+
+class _FakeModel:
+    """Stands in for the Gemini model; always answers with a date in the past"""
+    calls = 0
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def generate_content(self, prompt, **kwargs):
+        _FakeModel.calls += 1
+        return _FakeResponse("2020-01-01 10:00")
+
+
+@pytest.fixture
+def agent(monkeypatch):
+    monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
+    monkeypatch.setattr(ai_agent.genai, "configure", lambda **kwargs: None)
+    monkeypatch.setattr(ai_agent.genai, "GenerativeModel", _FakeModel)
+    _FakeModel.calls = 0
+    return AICommunicationAgent()
+
+
+def test_today_input_keeps_todays_date(agent):
+    result = agent.parse_schedule_request("today at 2 pm")
+    assert result["success"]
+    local = result["datetime"].astimezone(IST)
+    assert (local.date(), local.hour, local.minute) == (date.today(), 14, 0)
+    assert _FakeModel.calls == 0
+
+
+def test_past_model_date_is_moved_to_today(agent):
+    result = agent.parse_schedule_request("first thing on new year's day 2020")
+    assert result["success"]
+    local = result["datetime"].astimezone(IST)
+    assert (local.date(), local.hour, local.minute) == (date.today(), 10, 0)
+    assert _FakeModel.calls == 1
@@ -0,0 +1,108 @@
+"""
+Tests for the ttl_cached result cache used by the platform get_comments and
+get_post_status methods.
+"""
+
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import social_media_platforms
+from app.social_media_platforms import ttl_cached
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(social_media_platforms, "monotonic", clock)
+    return clock
+
+
+class _FakePlatform:
+    """Minimal platform carrying the cache attributes ttl_cached expects"""
+
+    def __init__(self, success=True):
+        self._result_cache = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+        self.success = success
+        self.calls = 0
+
+    @ttl_cached(30)
+    def get_comments(self, post_id, limit=10):
+        self.calls += 1
+        if not self.success:
+            return {"success": False, "error": "boom"}
+        return {"success": True, "comments": [{"id": f"{post_id}-{n}"} for n in range(limit)]}
+
+    @ttl_cached(0)
+    def get_post_status(self, post_id):
+        self.calls += 1
+        return {"success": True, "status": {"likes": self.calls}}
+
+
+def test_hit_within_ttl(clock):
+    platform = _FakePlatform()
+    first = platform.get_comments("p1")
+    clock.now += 29
+    assert platform.get_comments("p1") == first
+    assert platform.calls == 1
+
+
+def test_expired_entry_is_refetched(clock):
+    platform = _FakePlatform()
+    platform.get_comments("p1")
+    clock.now += 30
+    platform.get_comments("p1")
+    assert platform.calls == 2
+
+
+def test_failures_are_not_cached(clock):
+    platform = _FakePlatform(success=False)
+    assert not platform.get_comments("p1")["success"]
+    assert not platform.get_comments("p1")["success"]
+    assert platform.calls == 2
+    assert not platform._result_cache
+
+
+def test_non_positive_ttl_bypasses_cache(clock):
+    platform = _FakePlatform()
+    assert platform.get_post_status("p1")["status"]["likes"] == 1
+    assert platform.get_post_status("p1")["status"]["likes"] == 2
+    assert not platform._result_cache
+
+
+def test_key_includes_post_id_and_limit(clock):
+    platform = _FakePlatform()
+    assert len(platform.get_comments("p1", limit=2)["comments"]) == 2
+    assert len(platform.get_comments("p1", limit=5)["comments"]) == 5
+    assert len(platform.get_comments("p1", 5)["comments"]) == 5
+    platform.get_comments("p2", limit=2)
+    assert platform.calls == 4
+    platform.get_comments("p1", limit=2)
+    platform.get_comments("p1", limit=5)
+    assert platform.calls == 4
+
+
+def test_callers_cannot_mutate_cached_result(clock):
+    platform = _FakePlatform()
+    first = platform.get_comments("p1", limit=2)
+    first["comments"].append({"id": "extra"})
+    first["comments"][0]["id"] = "changed"
+    second = platform.get_comments("p1", limit=2)
+    assert second["comments"] == [{"id": "p1-0"}, {"id": "p1-1"}]
+    second["comments"].clear()
+    assert len(platform.get_comments("p1", limit=2)["comments"]) == 2
+    assert platform.calls == 1